@@ -1,253 +1,305 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from io import BytesIO
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-
-st.set_page_config(page_title="Garden State Brickface & Siding Pricing Calculator", page_icon="🏗️", layout="wide")
-
-st.markdown("""
-<style>
-.stApp {
-background-color: #FFFFFF;
-color: #000000;
-}
-.stTextInput input, .stNumberInput input, .stSelectbox select {
-background-color: #F0F2F6;
-color: #000000;
-}
-.stDataFrame, [data-testid="stDataFrame"] {
-background-color: #FFFFFF;
-}
-.stDataFrame table {
-background-color: #F0F2F6 !important;
-}
-.stDataFrame thead tr th {
-background-color: #E8EAF0 !important;
-color: #000000 !important;
-}
-.stDataFrame tbody tr {
-background-color: #F0F2F6 !important;
-}
-h1, h2, h3, h4, h5, h6, .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
-color: #000000 !important;
-}
-.stTabs [data-baseweb="tab-list"] {
-background-color: #F0F2F6;
-}
-.stTabs [data-baseweb="tab"] {
-color: #000000;
-}
-.stButton button {
-background-color: #FF4B4B;
-color: #FFFFFF;
-}
-[data-testid="stMetricValue"] {
-color: #000000;
-}
-p, span, label {
-color: #000000 !important;
-}
-hr {
-border-color: #E0E0E0;
-}
-</style>
-""", unsafe_allow_html=True)
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import metrics
+import dims
+import estimate
+import grids
+import money
+import scenarios
+import store
+from catalog import EDITABLE_TABLES, STONE_GUIDELINES
+from memo import Memo
+from pricing import gutter_minimum, ladder_rows, line_rows, num, sum_outs
+from painting import OUTS_KEYS as PAINTING_OUTS
+from startup import CSS, PAGE, TAB_INPUTS, load_catalog
+from stucco import OUTS_KEYS as STUCCO_OUTS
+
+def session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else ''
+
+def laps(prefix):
+    return metrics.laps(prefix, session_id()) if metrics.ENABLED else metrics.NO_LAPS
+
+st.set_page_config(**PAGE)
+timer = laps('app')
+
+st.markdown(CSS, unsafe_allow_html=True)
+timer.lap('css')
+
+catalog = load_catalog()
+timer.lap('catalog')
 
 if 'current_service' not in st.session_state:
     st.session_state.current_service = 'gutters'
 
-if 'measurements' not in st.session_state:
-    st.session_state.measurements = {
-        'gutters': pd.DataFrame(columns=['Location', 'Gutter Type', 'LF']),
-        'leaders': pd.DataFrame(columns=['Location', 'Leader Type', 'LF']),
-        'guards': pd.DataFrame(columns=['Location', 'Guard Type', 'LF'])
-    }
-
-if 'stone_measurements' not in st.session_state:
-    st.session_state.stone_measurements = {
-        'flats': pd.DataFrame([[''] * 4 for _ in range(12)], columns=['Location', 'Width', 'Height', 'Total SF']),
-        'corners': pd.DataFrame([[''] * 2 for _ in range(12)], columns=['Location', 'LF']),
-        'sills': pd.DataFrame([[''] * 2 for _ in range(12)], columns=['Location', 'LF']),
-        'outs': pd.DataFrame([[''] * 4 for _ in range(8)], columns=['Location', 'Width', 'Height', 'Total'])
-    }
-
-if 'stucco_measurements' not in st.session_state:
-    st.session_state.stucco_measurements = {
-        'walls': pd.DataFrame([[''] * 5 for _ in range(28)], columns=['Location', 'Width', 'x', 'Height', 'Total SF']),
-        'window_trim': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'door_trim': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'soffit': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'fascia': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'quions': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Quantity']),
-        'other_trim': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Quantity'])
-    }
-
-if 'painting_measurements' not in st.session_state:
-    st.session_state.painting_measurements = {
-        'walls': pd.DataFrame([[''] * 5 for _ in range(28)], columns=['Location', 'Width', 'x', 'Height', 'Total SF']),
-        'window_trim': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Openings']),
-        'door_trim': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Openings']),
-        'soffit': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'fascia': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'LF']),
-        'entry_doors': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Openings']),
-        'garage_doors': pd.DataFrame([[''] * 2 for _ in range(8)], columns=['Location', 'Openings'])
-    }
-
-if 'stone_pricing' not in st.session_state:
-    st.session_state.stone_pricing = {
-        'demolition': pd.DataFrame([['Remove vinyl or aluminum siding', '', 237], ['Remove wood siding (clapboard)', '', 267], ['Remove wood siding (wood shake)', '', 297], ['Remove EIFS up to 2" only', '', 400]], columns=['Description', 'Per Square', 'Price']),
-        'debris': pd.DataFrame([['Debris removal under 4 squares (REQUIRED even if no demo)', '', 830], ['10 yard dumpster (removal from 4 to 10 squares)', '', 1542], ['20 yard dumpster (removal from 11 to 20 squares)', '', 1868]], columns=['Description', 'Quantity', 'Price']),
-        'misc': pd.DataFrame([['Wrap Corner 4" (Wood or Vinyl Siding)', 'Per 8\' Corner', '', 297], ['Limestone Treads (up to 12" Deep)', 'LF', '', 128], ['Limestone Treads (up to 14" Deep)', 'LF', '', 144], ['Cement Pad (Up to 20sf) Demo/New', 'Per Item', '', 890], ['Chimney Scaffolding Fee', 'Full chimney or on roof', '', 741], ['Stainless Steel Chimney Cover', 'Per Item', '', 1605], ['1/2" Plywood Replacement', 'Per Item', '', 374]], columns=['Description', 'Unit', 'SF/LF/Q', 'Price'])
-    }
-
 if 'customer_info' not in st.session_state:
     st.session_state.customer_info = {'customer_name': '', 'project_address': '', 'sales_rep': ''}
 
-SERVICE_DATA = {
-    'gutters': {
-        'name': 'Gutters and Leaders',
-        'items': {
-            'Gutter 5" white': {'price': 13, 'category': 'gutters'},
-            'Gutter 5" all colors': {'price': 15, 'category': 'gutters'},
-            'Gutter 6" white': {'price': 18, 'category': 'gutters'},
-            'Gutter 6" all colors': {'price': 19, 'category': 'gutters'},
-            'Extra Gauge (0.032 gauge)': {'price': 1, 'category': 'gutters'},
-            'Leaders 2x3 white': {'price': 12, 'category': 'leaders'},
-            'Leaders 2x3 all colors': {'price': 13, 'category': 'leaders'},
-            'Leader 2x3 white - PVC': {'price': 18, 'category': 'leaders'},
-            'Leaders 3x4 white': {'price': 15, 'category': 'leaders'},
-            'Leaders 3x4 all colors': {'price': 16, 'category': 'leaders'},
-            'Leader 3" Round Corrugated - White': {'price': 47, 'category': 'leaders'},
-            'Extra Gauge (0.032 gauge) Leader': {'price': 1, 'category': 'leaders'},
-            'Shur-flow 5" (white)': {'price': 15, 'category': 'guards'},
-            'Shur-flow 5" (black or aluminum)': {'price': 16, 'category': 'guards'},
-            'Shur-flow 6" (white)': {'price': 16, 'category': 'guards'},
-            'Shur-flow 6" (black or aluminum)': {'price': 18, 'category': 'guards'},
-            'Screen 5"': {'price': 10, 'category': 'guards'},
-            'Screen 6"': {'price': 12, 'category': 'guards'},
-            'Leafshelter 6" - White': {'price': 18, 'category': 'guards'},
-            'Leafshelter 6" - All Colors': {'price': 21, 'category': 'guards'},
-            'Strap Hangers per LF': {'price': 4, 'category': 'guards'}
-        }
-    }
-}
+# Only the open tab runs, and Streamlit drops the state of widgets that were
+# not drawn on a run. Writing the closed tabs' inputs back keeps them for the
+# PDF estimate.
+for k in TAB_INPUTS:
+    if k in st.session_state:
+        st.session_state[k] = st.session_state[k]
 
-def calc_totals_gutters():
-    tots = {}
-    for cat in ['gutters', 'leaders', 'guards']:
-        for _, r in st.session_state.measurements[cat].iterrows():
-            col = 'Gutter Type' if cat == 'gutters' else ('Leader Type' if cat == 'leaders' else 'Guard Type')
-            if pd.notna(r[col]) and pd.notna(r['LF']):
-                itm = r[col]
-                if itm in SERVICE_DATA['gutters']['items'] and SERVICE_DATA['gutters']['items'][itm]['category'] == cat:
-                    if itm not in tots:
-                        tots[itm] = {'qty': 0, 'price': SERVICE_DATA['gutters']['items'][itm]['price'], 'total': 0}
-                    tots[itm]['qty'] += float(r['LF'])
-    for i in tots:
-        tots[i]['total'] = tots[i]['qty'] * tots[i]['price']
-    return tots, sum([t['total'] for t in tots.values()])
+# A new rate card re-rates the session's pricing editors and keeps what the
+# rep typed into them.
+if st.session_state.get('ratecard') != catalog.version:
+    for service in EDITABLE_TABLES:
+        if f'{service}_pricing' in st.session_state:
+            st.session_state[f'{service}_pricing'] = catalog.new_pricing(service, st.session_state[f'{service}_pricing'])
+    st.session_state.ratecard = catalog.version
+timer.lap('session_init')
+
+def open_tab(service):
+    st.session_state.current_service = service
+    grids.ensure(st.session_state, service, catalog)
+    if service in EDITABLE_TABLES and f'{service}_pricing' not in st.session_state:
+        st.session_state[f'{service}_pricing'] = catalog.new_pricing(service)
+
+def session_memo():
+    if 'memo' not in st.session_state:
+        st.session_state.memo = Memo()
+    return st.session_state.memo
 
 def calc_pricing(sub, rep=False, rig=False):
-    y1 = sub
-    d1 = y1 * 0.10
-    d30 = y1 - d1
-    d2 = d30 * 0.10
-    dof = d30 - d2
-    d3 = dof * 0.03
-    fin = dof - d3
-    if rep:
-        fin += 2100
-    if rig:
-        fin += 1400
-    return {'y1': y1, 'd1': d1, 'd30': d30, 'd2': d2, 'dof': dof, 'd3': d3, 'rep': 2100 if rep else 0, 'rig': 1400 if rig else 0, 'fin': fin}
+    return session_memo().pricing(sub, rep, rig)
 
-st.title("🏗️ Garden State Brickface & Siding Pricing Calculator")
-st.markdown("---")
+def calc_totals_gutters():
+    return session_memo().totals('gutters', st.session_state.measurements, catalog)
 
-tabs = st.tabs(["Gutters & Leaders", "Stone Veneer", "Stucco Painting", "House Painting"])
+def calc_totals_stone():
+    ss = st.session_state
+    return session_memo().totals('stone', {**ss.stone_measurements, **ss.stone_pricing}, catalog, zone=ss.get('stone_zone', 0))
 
-with tabs[0]:
-    st.session_state.current_service = 'gutters'
-    st.warning("⚠️ 50% deposit required | JOB MINIMUM: $650 (combined) / $1,150 (stand-alone)")
+def calc_totals_stucco():
+    ss = st.session_state
+    return session_memo().totals('stucco', {**ss.stucco_measurements, **ss.stucco_pricing}, catalog, outs=sum_outs(ss.get(k) for k in STUCCO_OUTS))
+
+def calc_totals_painting():
+    ss = st.session_state
+    return session_memo().totals('painting', {**ss.painting_measurements, **ss.painting_pricing}, catalog, outs=sum_outs(ss.get(k) for k in PAINTING_OUTS),
+                                 substrate=ss.get('p_substrate', 0), shutters=(ss.get('p_shutters_rr', 0), ss.get('p_shutters_paint', 0)))
+
+# The services besides gutters, in job order.
+OTHER_SERVICES = [('stone', calc_totals_stone), ('stucco', calc_totals_stucco), ('painting', calc_totals_painting)]
+
+def gutters_combined():
+    # Gutters take the combined minimum once another service has priced lines.
+    return any(grids.allocated(st.session_state, s) and len(calc()[0]) for s, calc in OTHER_SERVICES)
+
+def show_ladder(prc):
+    rows = ladder_rows(prc)
+    rows[-1] = [f"**{v}**" for v in rows[-1]]
+    st.dataframe(pd.DataFrame(rows, columns=['Description', 'Amount']), hide_index=True, use_container_width=True)
+
+def price_table(category, tots, qty_col='Linear Ft'):
+    df = catalog.gutter_tables[category].copy()
+    df.insert(1, qty_col, [tots[k]['qty'] if k in tots else 0 for k in df['Item']])
+    df['Price'] = [f"${tots[k]['total']:.2f}" if k in tots else "$0.00" for k in df['Item']]
+    return df
+
+def job_estimate():
+    # Every opened tab's priced lines, from the memo, combined into one job.
+    # Tabs that were never opened have no grids and nothing to price.
+    ss = st.session_state
+    parts = {}
+    if grids.allocated(ss, 'gutters'):
+        parts['gutters'] = estimate.gutter_lines(calc_totals_gutters()[0], catalog)
+    for service, calc in OTHER_SERVICES:
+        if grids.allocated(ss, service):
+            parts[service] = calc()[0]
+    rep = ss.get('st_rep', False) or ss.get('p_rep', False)
+    rig = ss.get('st_rig', False) or ss.get('p_rig', False)
+    return estimate.combine(parts, rep, rig, catalog)
+
+def summary_key(subtotals, prc):
+    return tuple(subtotals.items()), prc['fin']
+
+def refresh_summary():
+    # The job summary is drawn outside the tab fragments. When it is open and
+    # an edit in a tab moved the job's totals, rerun the app so it catches up.
+    ss = st.session_state
+    if ss.get('job_summary') and 'summary_key' in ss and get_script_run_ctx().fragment_ids_this_run:
+        if summary_key(*job_estimate()[1:]) != ss.summary_key:
+            st.rerun(scope="app")
+
+def estimate_sections():
+    return estimate.sections(*job_estimate())
+
+def estimate_state():
+    ss = st.session_state
+    keys = [key for key, _ in grids.GRIDS.values()] + [f'{s}_pricing' for s in EDITABLE_TABLES]
+    return {'tables': {k: dict(ss[k]) for k in keys if k in ss}, 'options': {k: ss[k] for k in TAB_INPUTS if k in ss}}
+
+def save_estimate(sections):
+    st.session_state.save_job = store.save({'customer': dict(st.session_state.customer_info), 'sections': sections, 'state': estimate_state(), 'ratecard': catalog.version})
+
+def reopen_estimate(estimate_id):
+    # Runs as a button callback, before any widget is drawn, so widget keys
+    # can still be set. Editor deltas belong to the old frames and are dropped.
+    est = store.load(estimate_id)
+    if est is None:
+        return
+    ss = st.session_state
+    tables, options = est['state']['tables'], est['state']['options']
+    for k in [k for k in ss if k.endswith('_ed')]:
+        del ss[k]
+    for service, (key, _) in grids.GRIDS.items():
+        ss.pop(key, None)
+        if key in tables:
+            ss[key] = {t: grids.typed(df, t, catalog) for t, df in tables[key].items()}
+    for service, editable in catalog.editable.items():
+        ss.pop(f'{service}_pricing', None)
+        if f'{service}_pricing' in tables:
+            ss[f'{service}_pricing'] = {t: df.astype(editable[t].dtypes.to_dict()) for t, df in tables[f'{service}_pricing'].items()}
+    for k in TAB_INPUTS:
+        ss.pop(k, None)
+        if k in options:
+            ss[k] = options[k]
+    ss.customer_info = dict(est['customer'])
+    # Saved rates are re-rated on the next run if the card has changed since.
+    ss.ratecard = est['ratecard']
+    ss.pop('save_job', None)
+
+# Width and Height are typed as text so reps can enter feet and inches.
+DIM_CONFIG = {**{c: st.column_config.TextColumn(help="Feet, or feet and inches: 12'6\"") for c in dims.DIM_COLS},
+              **{c: st.column_config.NumberColumn(format="%.2f") for c in ('Total SF', 'Total')}}
+
+def measured(df, total_col):
+    df, bad = dims.measure(df, total_col)
+    if len(bad):
+        st.warning("Not a dimension: " + ", ".join(f"row {r.row + 1} {r.column} “{r.text}”" for r in bad.itertuples()))
+    return df
+
+def table_rows(tables):
+    return sum(len(df) for df in tables.values())
+
+def pdf_status(polling=False):
+    # A polling status fragment keeps its run_every until the app reruns, so
+    # once its job is done it reruns the app once to be registered without it.
+    job = st.session_state.get('pdf_job')
+    if job is None:
+        return
+    fut, fname = job
+    if polling and fut.done():
+        st.rerun(scope="app")
+    if not fut.done():
+        st.info("⏳ Rendering PDF estimate...")
+    elif fut.exception():
+        st.error(f"PDF generation failed: {fut.exception()}")
+    else:
+        st.download_button("⬇️ Download PDF Estimate", fut.result(), file_name=fname, mime="application/pdf", key="pdf_dl")
+
+def save_status(polling=False):
+    fut = st.session_state.get('save_job')
+    if polling and fut is not None and fut.done():
+        st.rerun(scope="app")
+    if fut is None or not fut.done():
+        return
+    if fut.exception():
+        st.error(f"Saving the estimate failed: {fut.exception()}")
+    else:
+        st.caption(f"💾 Saved as estimate #{fut.result()}")
+
+def compare_options(tots, sub):
+    cols = st.columns(3)
+    swaps = {c: col.multiselect(f"Price all {c} as", [t for t in scenarios.TYPES[c] if t in catalog.price], key=f"cmp_{c}") for c, col in zip(scenarios.TYPES, cols)}
+    col1, col2 = st.columns(2)
+    rep = (False, True) if col1.checkbox("With and without repair ($2,100)", key="cmp_rep") else (False,)
+    rig = (False, True) if col2.checkbox("With and without rigging ($1,400)", key="cmp_rig") else (False,)
+    options = scenarios.matrix(tots, sub, swaps, rep, rig, catalog, gutters_combined())
+    st.dataframe(options, hide_index=True, use_container_width=True,
+                 column_config={k: st.column_config.NumberColumn(label, format="$%.2f") for k, label in
+                                [('y1', "1 Year Price"), ('d30', "30 Day Price"), ('dof', "Day of Price"), ('fin', "Final Sell Price")]})
+    st.caption(f"{len(options)} option(s)")
+
+@st.fragment
+def gutters_tab():
+    t = laps('gutters')
+    open_tab('gutters')
+    st.warning(f"⚠️ {catalog.gutter_terms}")
     st.subheader("Measurements")
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown("**GUTTERS**")
-        g_df = st.data_editor(st.session_state.measurements['gutters'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Gutter Type": st.column_config.SelectboxColumn(options=[k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'gutters']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="g_ed")
-        st.session_state.measurements['gutters'] = g_df
+        g_df = st.data_editor(st.session_state.measurements['gutters'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Gutter Type": st.column_config.SelectboxColumn(options=catalog.by_category['gutters']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="g_ed")
+        st.session_state.measurements['gutters'] = grids.typed(g_df, 'gutters', catalog)
     with col2:
         st.markdown("**LEADERS**")
-        l_df = st.data_editor(st.session_state.measurements['leaders'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Leader Type": st.column_config.SelectboxColumn(options=[k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'leaders']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="l_ed")
-        st.session_state.measurements['leaders'] = l_df
+        l_df = st.data_editor(st.session_state.measurements['leaders'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Leader Type": st.column_config.SelectboxColumn(options=catalog.by_category['leaders']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="l_ed")
+        st.session_state.measurements['leaders'] = grids.typed(l_df, 'leaders', catalog)
     with col3:
         st.markdown("**GUTTER GUARDS**")
-        gg_df = st.data_editor(st.session_state.measurements['guards'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Guard Type": st.column_config.SelectboxColumn(options=[k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'guards']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="gg_ed")
-        st.session_state.measurements['guards'] = gg_df
+        gg_df = st.data_editor(st.session_state.measurements['guards'], num_rows="dynamic", column_config={"Location": st.column_config.SelectboxColumn(options=["FRONT", "RIGHT", "BACK", "LEFT"]), "Guard Type": st.column_config.SelectboxColumn(options=catalog.by_category['guards']), "LF": st.column_config.NumberColumn(format="%.2f")}, hide_index=True, key="gg_ed")
+        st.session_state.measurements['guards'] = grids.typed(gg_df, 'guards', catalog)
+    t.lap('measurements', lambda: table_rows(st.session_state.measurements))
     st.markdown("### Pricing Tables")
     tots, sub = calc_totals_gutters()
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown("**Gutters (Standard) .27 Gauge**")
-        g_price = pd.DataFrame([[k, tots.get(k, {'qty': 0})['qty'], f"${SERVICE_DATA['gutters']['items'][k]['price']:.2f}", f"${tots.get(k, {'total': 0})['total']:.2f}"] for k in [k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'gutters']], columns=['Item', 'Linear Ft', 'Price Per Ft', 'Price'])
+        g_price = price_table('gutters', tots)
         st.dataframe(g_price, hide_index=True, use_container_width=True)
     with col2:
         st.markdown("**Leaders (Standard) .19 Gauge**")
-        l_price = pd.DataFrame([[k, tots.get(k, {'qty': 0})['qty'], f"${SERVICE_DATA['gutters']['items'][k]['price']:.2f}", f"${tots.get(k, {'total': 0})['total']:.2f}"] for k in [k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'leaders']], columns=['Item', 'Linear Ft', 'Price Per Ft', 'Price'])
+        l_price = price_table('leaders', tots)
         st.dataframe(l_price, hide_index=True, use_container_width=True)
     with col3:
         st.markdown("**Gutter Guards**")
-        gg_price = pd.DataFrame([[k, tots.get(k, {'qty': 0})['qty'], f"${SERVICE_DATA['gutters']['items'][k]['price']:.2f}", f"${tots.get(k, {'total': 0})['total']:.2f}"] for k in [k for k, v in SERVICE_DATA['gutters']['items'].items() if v['category'] == 'guards']], columns=['Item', 'LF/Quantity', 'Price Per Ft', 'Price'])
+        gg_price = price_table('guards', tots, 'LF/Quantity')
         st.dataframe(gg_price, hide_index=True, use_container_width=True)
     if st.button("Calculate", key="calc_g"):
         st.markdown("### Project Calculation")
-        prc = calc_pricing(sub)
-        calc_df = pd.DataFrame([['1 Year Price', f"${prc['y1']:.2f}"], ['Deduct 10%', f"(${prc['d1']:.2f})"], ['30 Day Price', f"${prc['d30']:.2f}"], ['Deduct 10%', f"(${prc['d2']:.2f})"], ['Day of Price', f"${prc['dof']:.2f}"], ['Deduct 3% for 33% Deposit', f"(${prc['d3']:.2f})"], ['**FINAL SELL PRICE**', f"**${prc['fin']:.2f}**"]], columns=['Description', 'Amount'])
-        st.dataframe(calc_df, hide_index=True, use_container_width=True)
+        short = gutter_minimum(money.cents(sub), gutters_combined(), catalog)
+        if short:
+            st.caption(f"Includes ${money.dollars(short):,.2f} to reach the gutter job minimum")
+        show_ladder(calc_pricing(money.dollars(money.cents(sub) + short)))
+    t.lap('pricing', len(tots))
+    compare = st.expander("⚖️ Compare options", key="g_compare", on_change="rerun")
+    with compare:
+        if compare.open:
+            compare_options(tots, sub)
+            t.lap('compare')
+    refresh_summary()
 
-with tabs[1]:
-    st.session_state.current_service = 'stone'
+@st.fragment
+def stone_tab():
+    t = laps('stone')
+    open_tab('stone')
     st.subheader("Stone Veneer Measurements")
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown("### STONE FLATS")
-        flats_df = st.data_editor(st.session_state.stone_measurements['flats'], hide_index=True, use_container_width=True, key="flats_ed")
-        st.session_state.stone_measurements['flats'] = flats_df
-        st.text_input("Flats SF Subtotal", key="flats_subtotal")
-        st.text_input("Deduct Outs (   )", key="deduct_outs")
-        st.markdown("**Total Flats** (yellow highlight)")
+        flats_df = st.data_editor(st.session_state.stone_measurements['flats'], hide_index=True, use_container_width=True, column_config=DIM_CONFIG, key="flats_ed")
+        st.session_state.stone_measurements['flats'] = measured(flats_df, 'Total SF')
+        flats_box = st.container()
     with col2:
         st.markdown("### STONE CORNERS")
         corners_df = st.data_editor(st.session_state.stone_measurements['corners'], hide_index=True, use_container_width=True, key="corners_ed")
         st.session_state.stone_measurements['corners'] = corners_df
-        st.text_input("Subtotal", key="corners_subtotal")
+        corners_sub = st.empty()
         st.info("IF ODD # ROUND UP TO NEAREST EVEN FOOT")
-        st.markdown("**Total Corners** (yellow highlight)")
+        corners_tot = st.empty()
     with col3:
         st.markdown("### STONE SILLS")
         sills_df = st.data_editor(st.session_state.stone_measurements['sills'], hide_index=True, use_container_width=True, key="sills_ed")
         st.session_state.stone_measurements['sills'] = sills_df
-        st.text_input("Subtotal", key="sills_subtotal")
+        sills_sub = st.empty()
         st.info("IF ODD # ROUND UP TO NEAREST EVEN FOOT")
-        st.markdown("**Total Sills** (yellow highlight)")
+        sills_tot = st.empty()
     
     st.markdown("### OUTS (TAKE 100% OUTS)")
-    outs_df = st.data_editor(st.session_state.stone_measurements['outs'], hide_index=True, use_container_width=True, key="outs_ed")
-    st.session_state.stone_measurements['outs'] = outs_df
-    st.text_input("Total Outs (   )", key="total_outs")
+    outs_df = st.data_editor(st.session_state.stone_measurements['outs'], hide_index=True, use_container_width=True, column_config=DIM_CONFIG, key="outs_ed")
+    st.session_state.stone_measurements['outs'] = measured(outs_df, 'Total')
+    outs_slot = st.empty()
     
-    st.info("""**STONE VENEER GUIDELINES**
-* Measurements must be tip to tip
-* Brick returns at windows/doors, must include in SF & LF
-* New treads/cap required if existing overhang is not a min of 2 1
-* Charge wrap corner fee if turning into vinyl siding or wood sidin
-* Chimney caps required when stone on chimneys
-* Chimney scaffolding required if stone on chimney""")
+    st.info("**STONE VENEER GUIDELINES**\n" + "\n".join(f"* {g}" for g in STONE_GUIDELINES))
     
+    t.lap('measurements', lambda: table_rows(st.session_state.stone_measurements))
     st.markdown("---")
     st.subheader("Stone Veneer Pricing")
     
@@ -256,47 +308,64 @@ with tabs[1]:
     st.session_state.stone_pricing['demolition'] = demo_df
     
     st.markdown("### DEBRIS REMOVAL (REQUIRED ON ALL JOBS)")
-    debris_df = st.data_editor(st.session_state.stone_pricing['debris'], hide_index=True, use_container_width=True, key="debris_ed")
-    st.session_state.stone_pricing['debris'] = debris_df
+    debris_slot = st.empty()
     st.info("** Dumpsters can be provided by the customer at their own expense - they would soley be responsible for delivery, pick up and weight overage fees if applicable. Must be written that way on contract")
     
     st.markdown("### STONE ITEMS (REQUIRED ON ALL JOBS)")
-    stone_items_data = [
-        ['Stone Flats (1/2" joint only)', 'SF', '', 58],
-        ['Stone Corners', 'LF', '', 32],
-        ['Chiseled Stone Sills', 'LF', '', 26]
-    ]
-    stone_items_df = pd.DataFrame(stone_items_data, columns=['Description', 'SF/LF/Q', 'Price', 'Sub-Total'])
-    st.dataframe(stone_items_df, hide_index=True, use_container_width=True)
+    items_slot = st.empty()
     
     st.markdown("### MISCELLANEOUS")
     misc_df = st.data_editor(st.session_state.stone_pricing['misc'], hide_index=True, use_container_width=True, key="misc_ed")
     st.session_state.stone_pricing['misc'] = misc_df
     
     st.markdown("### JOB MINIMUMS")
-    minimums_data = [
-        ['All counties excluding below', '$7,500'],
-        ['Zone (1): Sussex, Warren, Hunterdon, Mercer', '$8,500'],
-        ['Zone (2): Ocean, Burlington, Camden', '$9,500']
-    ]
-    minimums_df = pd.DataFrame(minimums_data, columns=['Description', 'AMOUNT'])
-    st.dataframe(minimums_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['stone_minimums'], hide_index=True, use_container_width=True)
+    st.selectbox("County Zone", range(len(catalog.tables['stone_minimums'])), format_func=lambda i: catalog.tables['stone_minimums'][i][0], key="stone_zone")
+    
+    lines, info, sub = calc_totals_stone()
+    flats_box.metric("Flats SF Subtotal", f"{info['flats_sf']:g}")
+    flats_box.metric("Deduct Outs", f"({info['outs_sf']:g})")
+    flats_box.metric("Total Flats", f"{info['net_sf']:g}")
+    corners_sub.metric("Subtotal", f"{num(corners_df['LF']).sum():g}")
+    corners_tot.metric("Total Corners", f"{info['corners_lf']:g}")
+    sills_sub.metric("Subtotal", f"{num(sills_df['LF']).sum():g}")
+    sills_tot.metric("Total Sills", f"{info['sills_lf']:g}")
+    outs_slot.metric("Total Outs", f"({info['outs_sf']:g})")
+    debris = catalog.frames['stone_debris'].copy()
+    if info['debris']:
+        debris.loc[info['debris'][0], 'Quantity'] = str(info['debris'][1])
+    debris_slot.dataframe(debris, hide_index=True, use_container_width=True)
+    qty = (info['net_sf'], info['corners_lf'], info['sills_lf'])
+    items = pd.DataFrame({'Description': catalog.frames['stone_items']['Description'],
+                          'SF/LF/Q': [f"{q:g} {u}" for q, u in zip(qty, catalog.frames['stone_items']['SF/LF/Q'])],
+                          'Price': [f"${r:.2f}" for r in catalog.stone_item_rates],
+                          'Sub-Total': [f"${money.dollars(money.extend(q, r)):.2f}" for q, r in zip(qty, catalog.stone_item_rates)]})
+    items_slot.dataframe(items, hide_index=True, use_container_width=True)
+    
+    st.markdown("### Project Calculation")
+    if len(lines):
+        st.dataframe(pd.DataFrame(line_rows(lines), columns=['Item', 'Qty', 'Price', 'Total']), hide_index=True, use_container_width=True)
+    show_ladder(calc_pricing(sub))
+    t.lap('pricing', len(lines))
+    refresh_summary()
 
-with tabs[2]:
-    st.session_state.current_service = 'stucco'
+@st.fragment
+def stucco_tab():
+    t = laps('stucco')
+    open_tab('stucco')
     st.subheader("Stucco Painting Measurements")
     
     col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
     with col1:
         st.markdown("### Walls")
-        walls_df = st.data_editor(st.session_state.stucco_measurements['walls'], hide_index=True, use_container_width=True, key="stucco_walls_ed")
-        st.session_state.stucco_measurements['walls'] = walls_df
+        walls_df = st.data_editor(st.session_state.stucco_measurements['walls'], hide_index=True, use_container_width=True, column_config=DIM_CONFIG, disabled=['x', 'Total SF'], key="stucco_walls_ed")
+        st.session_state.stucco_measurements['walls'] = measured(walls_df, 'Total SF')
         st.markdown("**Subtotal of Squares**")
         st.text_input("Front (Outs) (   )", key="stucco_front_outs")
         st.text_input("Front Right (Outs) (   )", key="stucco_front_right_outs")
         st.text_input("Rear (Outs) (   )", key="stucco_rear_outs")
         st.text_input("Front Left (Outs) (   )", key="stucco_front_left_outs")
-        st.text_input("Squares (Subtotal)", key="stucco_squares_subtotal")
+        squares_slot = st.empty()
         st.markdown("**Round up to Nearest Full Square**")
     
     with col2:
@@ -325,84 +394,30 @@ with tabs[2]:
         other_df = st.data_editor(st.session_state.stucco_measurements['other_trim'], hide_index=True, use_container_width=True, key="stucco_other_ed")
         st.session_state.stucco_measurements['other_trim'] = other_df
     
+    t.lap('measurements', lambda: table_rows(st.session_state.stucco_measurements))
     st.markdown("---")
     st.subheader("Stucco Painting Pricing")
     
     st.markdown("### LOXON XP (Above 8') - WALLS ONLY")
-    loxon_above_data = [
-        ['Includes ladders and access', '200 - 499', '', 14.27],
-        ['Includes powerwash of all work areas', '500 - 999', '', 13.00],
-        ['Crack repair up to 50 linear ft (1" or less)', '1000 - 1699', '', 12.45],
-        ['Apply Two Coats of Loxon XP', '1700 - 2999', '', 11.78],
-        ['Loxon will be rolled or sprayed at our discretion', '3000 - 4499', '', 11.38],
-        ['Wall texture will remain the same', 'Above 4500', '', 11.09]
-    ]
-    loxon_above_df = pd.DataFrame(loxon_above_data, columns=['Description', 'SF RANGE', 'SF', 'PRICE'])
-    st.dataframe(loxon_above_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['loxon_above'], hide_index=True, use_container_width=True)
     
     st.markdown("### LOXON XP (Below 8') - WALLS ONLY")
-    loxon_below_data = [
-        ['Does not include ladders, all ground work', '200 - 499', '', 9.69],
-        ['Includes powerwash of all work areas', '500 - 999', '', 9.11],
-        ['Crack repair up to 50 linear ft (1" or less)', '1000 - 1699', '', 8.73],
-        ['Apply Two Coats of Loxon XP', '1700 - 2999', '', 8.24],
-        ['Loxon will be rolled or sprayed at our discretion', '3000 - 4499', '', 7.95],
-        ['Wall texture will remain the same', 'Above 4500', '', 7.75]
-    ]
-    loxon_below_df = pd.DataFrame(loxon_below_data, columns=['Description', 'SF RANGE', 'SF', 'PRICE'])
-    st.dataframe(loxon_below_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['loxon_below'], hide_index=True, use_container_width=True)
     
     st.markdown("### LOXON XP (TRIM ONLY)")
-    loxon_trim_data = [
-        ['Two coats of Loxon XP over stucco window/door trim (up to 6")', 'Per LF', '', 7.25],
-        ['Two coats of Loxon XP over stucco soffit (up to 12")', 'Per LF', '', 11.67],
-        ['Two coats of Loxon XP over stucco fascia (up to 8")', 'Per LF', '', 8.15],
-        ['Apply two coats of Loxon XP over single side quion', 'Per Side', '', 11.67]
-    ]
-    loxon_trim_df = pd.DataFrame(loxon_trim_data, columns=['Description', '', 'PRICE', 'TOTAL'])
-    st.dataframe(loxon_trim_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['loxon_trim'], hide_index=True, use_container_width=True)
     
     st.markdown("### CAULKING (IN CONJUNCTION WITH LOXON PROJECT ONLY)")
-    caulking_data = [
-        ['Caulk only (no raking) - up to 3/4"', '', 8.36],
-        ['Caulk and install backer rod (no raking) - up to 3/4"', '', 11.17],
-        ['Rake out and caulk only - up to 3/4"', '', 12.54],
-        ['Rake out and install backer rod - up to 3/4"', '', 15.32]
-    ]
-    caulking_df = pd.DataFrame(caulking_data, columns=['Description', 'LF', 'PRICE'])
-    st.dataframe(caulking_df, hide_index=True, use_container_width=True)
+    caulk_df = st.data_editor(st.session_state.stucco_pricing['caulking'], hide_index=True, use_container_width=True, disabled=['Description', 'PRICE'], key="stucco_caulking_ed")
+    st.session_state.stucco_pricing['caulking'] = caulk_df
     
     st.markdown("### MISCELLANEOUS ITEMS")
-    misc_items_data = [
-        ['EIFS Repair', 'Per SF', '', 60],
-        ['BCMA (Fiberglass, Basecoat, Acrylic Stucco)', 'Per SF', '', 17.59],
-        ['Remove and Re-Install Existing Shutters', 'Per Pair', '', 145],
-        ['Remove, Paint and Re-Install Shutters (per pair)', 'Per Pair', '', 290],
-        ['Stainless Steel Chimney Cover', 'Per Item', '', 1509],
-        ['Plywood (demo, debris, install 1 sheet of plywood) 32 sf', 'Per Item', '', 439],
-        ['Remove and Re-Install Existing Gutters', 'Per LF', '', 6],
-        ['Additional Rigging (For Caulking Only Projects)', 'Per Side', '', 435],
-        ['Clear Sealer, Ladders, Powerwash', 'Per SF', '', 7],
-        ['Additional Heavy Duty Powerwash', 'Per SF', '', 2],
-        ['Additional stucco crack repair above 50 lf (1" or less)', 'Per LF', '', 7],
-        ['Spot Point Brick    (* See rules page)', 'Per SF', '', 29],
-        ['Full Cut and Re-Point (Under 500sf)', 'Per SF', '', 29]
-    ]
-    misc_items_df = pd.DataFrame(misc_items_data, columns=['Description', 'Unit', 'Quantity', 'PRICE'])
-    st.dataframe(misc_items_df, hide_index=True, use_container_width=True)
+    smisc_df = st.data_editor(st.session_state.stucco_pricing['misc'], hide_index=True, use_container_width=True, disabled=['Description', 'Unit', 'PRICE'], key="stucco_misc_ed")
+    st.session_state.stucco_pricing['misc'] = smisc_df
     
     st.markdown("### MINIMUMS (FOR WORK ON STANDARD 2 1/2 STORY HOMES LESS THAN 26\")")
-    minimums_data = [
-        ['LOXON', '$4,200'],
-        ['CLEAR SEALER', '$3,500'],
-        ['WOODPECKER HOLES (INCLUDES UP TO 6 HOLES) ADD $500 PER HOLE', '$3,500'],
-        ['BCMA', '$4,200'],
-        ['SPOT POINTING', '$4,900'],
-        ['FULL POINTING', '$5,600'],
-        ['CAULKING', '$5,600']
-    ]
-    minimums_df = pd.DataFrame(minimums_data, columns=['Service', 'Amount'])
-    st.dataframe(minimums_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['stucco_minimums'], hide_index=True, use_container_width=True)
+    st.info("JOBS ARE BILLED UP TO THE MINIMUM FOR THE WORK PRICED: LOXON WHEN THE JOB HAS LOXON WALLS OR TRIM, OTHERWISE THE LARGEST OF ITS CAULKING, CLEAR SEALER, BCMA AND POINTING MINIMUMS")
     
     col1, col2 = st.columns(2)
     with col1:
@@ -410,24 +425,32 @@ with tabs[2]:
     with col2:
         rig = st.checkbox("Add Rigging - $1,400", key="st_rig")
     
-    if st.button("Calculate", key="calc_st"):
-        st.info("Calculation based on measurements and pricing tables above")
+    lines, info, sub = calc_totals_stucco()
+    squares_slot.metric("Squares (Subtotal)", info['squares'], help=f"{info['gross_sf']:.0f} SF walls - {info['outs']:.0f} SF outs; {info['below_sf']:.0f} SF billed below 8', {info['above_sf']:.0f} SF above")
+    st.markdown("### Project Calculation")
+    if len(lines):
+        st.dataframe(pd.DataFrame(line_rows(lines), columns=['Item', 'Qty', 'Price', 'Total']), hide_index=True, use_container_width=True)
+    show_ladder(calc_pricing(sub, rep, rig))
+    t.lap('pricing', len(lines))
+    refresh_summary()
 
-with tabs[3]:
-    st.session_state.current_service = 'painting'
+@st.fragment
+def painting_tab():
+    t = laps('painting')
+    open_tab('painting')
     st.subheader("HOUSE PAINTING - 100% OUTS CAN BE TAKEN")
     
     col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
     with col1:
         st.markdown("### Walls")
-        walls_df = st.data_editor(st.session_state.painting_measurements['walls'], hide_index=True, use_container_width=True, key="painting_walls_ed")
-        st.session_state.painting_measurements['walls'] = walls_df
+        walls_df = st.data_editor(st.session_state.painting_measurements['walls'], hide_index=True, use_container_width=True, column_config=DIM_CONFIG, disabled=['x', 'Total SF'], key="painting_walls_ed")
+        st.session_state.painting_measurements['walls'] = measured(walls_df, 'Total SF')
         st.markdown("**Subtotal of Squares**")
         st.text_input("Front (Outs) (   )", key="painting_front_outs")
         st.text_input("Front Right (Outs) (   )", key="painting_front_right_outs")
         st.text_input("Rear (Outs) (   )", key="painting_rear_outs")
         st.text_input("Front Left (Outs) (   )", key="painting_front_left_outs")
-        st.text_input("Squares (Subtotal)", key="painting_squares_subtotal")
+        squares_slot = st.empty()
         st.markdown("**Round up to Nearest Full Square**")
     
     with col2:
@@ -456,50 +479,25 @@ with tabs[3]:
         garage_df = st.data_editor(st.session_state.painting_measurements['garage_doors'], hide_index=True, use_container_width=True, key="painting_garage_ed")
         st.session_state.painting_measurements['garage_doors'] = garage_df
     
+    t.lap('measurements', lambda: table_rows(st.session_state.painting_measurements))
     st.markdown("---")
     st.subheader("House Painting Pricing")
     
     st.markdown("### PAINTING (WALLS ONLY)")
-    walls_pricing_data = [
-        ['Vinyl and Aluminum ---- (Use vinyl safe colors for vinyl only)', '', 8.06, ''],
-        ['Wood Clapboard ---- (20% sand and spot prime)', '', 9.28, ''],
-        ['Wood Clapboard ---- (Full sanding only)', '', 11.5, ''],
-        ['Wood Shake ---- (20% sand and spot prime)', '', 10.02, ''],
-        ['Wood Shake ---- (Full sanding only)', '', 12.19, '']
-    ]
-    walls_pricing_df = pd.DataFrame(walls_pricing_data, columns=['Description', 'Total SF', 'Price Per SF', 'TOTAL'])
-    st.dataframe(walls_pricing_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['painting_walls'], hide_index=True, use_container_width=True)
+    st.selectbox("Wall Substrate", range(len(catalog.painting_wall_rates)), format_func=lambda i: catalog.frames['painting_walls'].at[i, 'Description'], key="p_substrate")
     
     st.markdown("### PAINTING (TRIM ONLY)")
-    trim_pricing_data = [
-        ['Window trim ---- (up to 4in wide)', 'Per Opening', '', 61.48, ''],
-        ['Door trim ---- (up to 4in wide)', 'Per Opening', '', 61.48, ''],
-        ['Fascia for frieze board trim ---- (up to 6in wide)', 'Per LF', '', 6.36, ''],
-        ['Soffit - Non Vented ---- (up to 12in deep)', 'Per LF', '', 8.48, ''],
-        ['Remove and re-install existing shutters', 'Per Pair', '', 77.38, ''],
-        ['Remove, paint and re-install existing shutters', 'Per Pair', '', 106.0, ''],
-        ['Single front entry door ---- (wood surface only)', 'Per Opening', '', 242.0, ''],
-        ['Garage doors ---- (wood surface only)', 'Per Opening', '', 530.0, '']
-    ]
-    trim_pricing_df = pd.DataFrame(trim_pricing_data, columns=['Description', '', 'Total Qty', 'Price Per Unit', 'TOTAL'])
-    st.dataframe(trim_pricing_df, hide_index=True, use_container_width=True)
+    st.dataframe(catalog.frames['painting_trim'], hide_index=True, use_container_width=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.number_input("Shutters: remove and re-install (pairs)", min_value=0, step=1, key="p_shutters_rr")
+    with col2:
+        st.number_input("Shutters: remove, paint and re-install (pairs)", min_value=0, step=1, key="p_shutters_paint")
     
     st.markdown("### MISCELLANEOUS ITEMS")
-    misc_painting_data = [
-        ['Remove / replace (1) sheet of plywood ---- (up to 32sf)', '', '', 316.94, ''],
-        ['Remove / replace wood siding ---- (up to 8 sq exposure)', 'Per 12ft Piece', '', 320.12, ''],
-        ['Remove / replace aluminum siding ---- (up to 8in exposure)', 'Per 12ft Piece', '', 320.12, ''],
-        ['Remove / replace wood trim ---- (2/4in x 3ft x 12ft)', 'Per 16ft Piece', '', 151.58, ''],
-        ['Remove / replace wood clapboard ---- (1/2in x 8in x 16ft)', 'Per 16ft Piece', '', 338.14, ''],
-        ['Remove / replace wood shake ---- (up to 12in Exposure)', 'Per 1/2 Square', '', 647.66, ''],
-        ['Remove / re-install existing gutters', 'Per LF', '', 4.24, ''],
-        ['Additional powerwash', 'Per SF', '', 1.59, ''],
-        ['Caulk only (no raking) ---- (up to 1/2in)', 'Per LF', '', 8.48, ''],
-        ['Rake out and caulk only ---- (up to 1/2in)', 'Per LF', '', 12.72, ''],
-        ['Paint samples ---- (includes 1 color sample)', 'Per Item', '', 82.68, '']
-    ]
-    misc_painting_df = pd.DataFrame(misc_painting_data, columns=['Description', '', 'Quantity', 'Price Per Unit', 'TOTAL'])
-    st.dataframe(misc_painting_df, hide_index=True, use_container_width=True)
+    pmisc_df = st.data_editor(st.session_state.painting_pricing['misc'], hide_index=True, use_container_width=True, disabled=['Description', '', 'Price Per Unit', 'TOTAL'], key="painting_misc_ed")
+    st.session_state.painting_pricing['misc'] = pmisc_df
     
     col1, col2 = st.columns(2)
     with col1:
@@ -507,32 +505,135 @@ with tabs[3]:
     with col2:
         rig = st.checkbox("Add Rigging - $1,400", key="p_rig")
     
-    if st.button("Calculate", key="calc_p"):
-        st.info("Calculation based on measurements and pricing tables above")
+    lines, info, sub = calc_totals_painting()
+    squares_slot.metric("Squares (Subtotal)", info['squares'], help=f"{info['gross_sf']:.0f} SF walls - {info['outs']:.0f} SF outs")
+    st.markdown("### Project Calculation")
+    if len(lines):
+        st.dataframe(pd.DataFrame(line_rows(lines), columns=['Item', 'Qty', 'Price', 'Total']), hide_index=True, use_container_width=True)
+    show_ladder(calc_pricing(sub, rep, rig))
+    t.lap('pricing', len(lines))
+    refresh_summary()
 
-st.markdown("---")
-st.header("Generate PDF Estimate")
-
-col1, col2, col3 = st.columns(3)
+@st.fragment
+def pdf_section():
+    t = laps('pdf')
+    col1, col2, col3 = st.columns(3)
 
-with col1:
-    cname = st.text_input("Customer Name", value=st.session_state.customer_info['customer_name'])
-    st.session_state.customer_info['customer_name'] = cname
+    with col1:
+        cname = st.text_input("Customer Name", value=st.session_state.customer_info['customer_name'])
+        st.session_state.customer_info['customer_name'] = cname
 
-with col2:
-    addr = st.text_input("Project Address", value=st.session_state.customer_info['project_address'])
-    st.session_state.customer_info['project_address'] = addr
+    with col2:
+        addr = st.text_input("Project Address", value=st.session_state.customer_info['project_address'])
+        st.session_state.customer_info['project_address'] = addr
 
-with col3:
-    srep = st.text_input("Sales Representative", value=st.session_state.customer_info['sales_rep'])
-    st.session_state.customer_info['sales_rep'] = srep
+    with col3:
+        srep = st.text_input("Sales Representative", value=st.session_state.customer_info['sales_rep'])
+        st.session_state.customer_info['sales_rep'] = srep
 
-if st.button("Generate PDF", type="primary"):
-    if not cname or not addr or not srep:
+    col1, col2 = st.columns([1, 5])
+    with col1:
+        generate = st.button("Generate PDF", type="primary")
+    with col2:
+        save = st.button("💾 Save Estimate")
+    if (generate or save) and (not cname or not addr or not srep):
         st.error("Fill in all fields")
-    else:
-        st.info("PDF generation functionality will be implemented with the measurements and pricing data entered above")
+    elif save:
+        save_estimate(estimate_sections())
+    elif generate:
+        est = {'customer': dict(st.session_state.customer_info), 'date': datetime.now().strftime('%m/%d/%Y'), 'sections': estimate_sections(),
+               'ratecard': catalog.version, 'minimums': {'stone': catalog.tables['stone_minimums'], 'stucco': catalog.tables['stucco_minimums']}, 'terms': catalog.gutter_terms}
+        fname = "Estimate_" + "".join(ch if ch.isalnum() else "_" for ch in cname) + f"_{datetime.now():%Y%m%d}.pdf"
+        # reportlab is only imported on the first PDF request in this process.
+        from pdf import submit_estimate
+        st.session_state.pdf_job = (submit_estimate(est), fname)
         st.info("📁 To save to Google Drive: Download the PDF, then upload it to https://drive.google.com/drive/folders/1i_Ka70_VlaucBYAwcfivChslVBKcoe57")
 
+    job = st.session_state.get('pdf_job')
+    polling = bool(job and not job[0].done())
+    st.fragment(pdf_status, run_every=1 if polling else None)(polling)
+    saved = st.session_state.get('save_job')
+    polling = bool(saved and not saved.done())
+    st.fragment(save_status, run_every=1 if polling else None)(polling)
+    t.lap('section')
+
+def job_summary_section():
+    t = laps('job')
+    lines, subtotals, prc = job_estimate()
+    st.session_state.summary_key = summary_key(subtotals, prc)
+    t.lap('combine', len(lines))
+    if not len(lines):
+        st.info("Nothing priced yet. Enter measurements on any service tab.")
+        return
+    for col, (service, v) in zip(st.columns(len(subtotals)), subtotals.items()):
+        col.metric(estimate.TITLES[service], f"${v:,.2f}")
+    rows = [[estimate.TITLES[s]] + r for s, r in zip(lines['service'], line_rows(lines))]
+    st.dataframe(pd.DataFrame(rows, columns=['Service', 'Item', 'Qty', 'Price', 'Total']), hide_index=True, use_container_width=True)
+    show_ladder(prc)
+
+@st.fragment
+def saved_estimates_section():
+    t = laps('saved')
+    q = st.text_input("Customer name, address or sales rep (starts with)", key="est_query")
+    found = store.search(q.strip())
+    t.lap('search', len(found))
+    if not len(found):
+        st.info("No saved estimates match.")
+        return
+    st.dataframe(found, hide_index=True, use_container_width=True,
+                 column_config={'id': "#", 'created': "Saved", 'customer_name': "Customer", 'project_address': "Address", 'sales_rep': "Sales Rep", 'ratecard': "Rate Card",
+                                'total': st.column_config.NumberColumn("Total", format="$%.2f")})
+    names = dict(zip(found['id'], found['customer_name']))
+    pick = st.selectbox("Estimate", found['id'], format_func=lambda i: f"#{i} · {names[i]}", key="est_pick")
+    if st.button("Open in editors", on_click=reopen_estimate, args=(pick,)):
+        st.rerun()
+
+st.title("🏗️ Garden State Brickface & Siding Pricing Calculator")
+st.markdown("---")
+
+tabs = st.tabs(["Gutters & Leaders", "Stone Veneer", "Stucco Painting", "House Painting"], key="service_tab", on_change="rerun")
+
+with tabs[0]:
+    if tabs[0].open:
+        gutters_tab()
+
+with tabs[1]:
+    if tabs[1].open:
+        stone_tab()
+
+with tabs[2]:
+    if tabs[2].open:
+        stucco_tab()
+
+with tabs[3]:
+    if tabs[3].open:
+        painting_tab()
+
+st.markdown("---")
+st.header("Job Estimate")
+job_summary = st.expander("🧾 All services on one estimate", key="job_summary", on_change="rerun")
+with job_summary:
+    if job_summary.open:
+        job_summary_section()
+
+st.markdown("---")
+st.header("Generate PDF Estimate")
+pdf_section()
+
+st.markdown("---")
+st.header("Saved Estimates")
+saved_estimates = st.expander("🔎 Search saved estimates", key="saved_estimates", on_change="rerun")
+with saved_estimates:
+    if saved_estimates.open:
+        saved_estimates_section()
+
 st.divider()
-st.caption("Garden State Brickface & Siding Pricing Calculator v3.0")
+st.caption(f"Garden State Brickface & Siding Pricing Calculator v3.0 · rate card {catalog.version}")
+
+if metrics.ENABLED:
+    with st.expander("⏱️ Rerun timings"):
+        recs = metrics.recent(session_id())
+        st.dataframe(pd.DataFrame(recs[::-1], columns=['ts', 'section', 'wall_ms', 'rows']), hide_index=True, use_container_width=True)
+        st.caption(f"Session {session_id()} · last {len(recs)} sections · measurement grids {grids.session_bytes(st.session_state) / 1024:.1f} KB")
+        st.caption(f"Subtotal memo: {session_memo().stats()}")
+    metrics.flush()
@@ -0,0 +1,132 @@
+"""Re-price saved jobs from the command line.
+
+    python batch.py jobs.jsonl -o priced.csv --workers 8
+
+JSONL input holds one job per line:
+
+    {"job_id": "1042", "gutters": [{"Gutter Type": "Gutter 5\\" white", "LF": 120}],
+     "leaders": [...], "guards": [...], "rep": false, "rig": true}
+
+CSV input holds one measurement per row, with the rows of a job kept together:
+
+    job_id,category,item,LF,rep,rig
+
+Each job is priced as the app quotes a stand-alone gutter job, with the
+gutter job minimum applied before the ladder.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, islice
+
+import numpy as np
+import pandas as pd
+
+import money
+from pricing import GUTTER_COLS, gutter_minimum, num, priced_gutters
+
+OUT_COLS = ['job_id', 'subtotal', 'y1', 'd1', 'd30', 'd2', 'dof', 'd3', 'rep', 'rig', 'fin']
+
+
+def _flag(v):
+    return str(v).strip().lower() in ('1', 'true', 'yes', 'y')
+
+
+def read_jsonl(path):
+    with open(path, newline='') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv(path):
+    with open(path, newline='') as f:
+        for job_id, rows in groupby(csv.DictReader(f), key=lambda r: r['job_id']):
+            rows = list(rows)
+            job = {'job_id': job_id, 'rep': _flag(rows[0].get('rep')), 'rig': _flag(rows[0].get('rig'))}
+            for cat, col in GUTTER_COLS.items():
+                job[cat] = [{col: r['item'], 'LF': r['LF']} for r in rows if r['category'] == cat]
+            yield job
+
+
+def read_jobs(path):
+    return read_csv(path) if path.endswith('.csv') else read_jsonl(path)
+
+
+def price_jobs(jobs):
+    # A whole task's worth of jobs goes through one catalog join, one
+    # group-by and one integer ladder; building a frame per job costs more
+    # than pricing it.
+    rows = [(i, cat, r.get(col), r.get('LF')) for i, job in enumerate(jobs) for cat, col in GUTTER_COLS.items() for r in job.get(cat) or []]
+    m = pd.DataFrame(rows, columns=['job', 'category', 'item', 'qty'], dtype=object)
+    m['qty'] = num(m['qty'])
+    m = priced_gutters(m)
+    # Lines are extended per job and item, as on the gutters tab, so both
+    # round the same quantities.
+    lines = m.groupby(['job', 'item', 'price'], sort=False)['qty'].sum().reset_index()
+    subs = pd.Series(money.extend(lines['qty'], lines['price'])).groupby(lines['job']).sum().reindex(range(len(jobs)), fill_value=0).to_numpy()
+    # A saved gutter job is a stand-alone gutter job, so it carries that minimum.
+    subs = subs + gutter_minimum(subs)
+    flags = np.array([(_flag(job.get('rep')), _flag(job.get('rig'))) for job in jobs], dtype=np.int64).reshape(-1, 2)
+    prc = {k: money.dollars(v).tolist() for k, v in money.ladder(subs, flags[:, 0], flags[:, 1]).items()}
+    return [{'job_id': job.get('job_id'), 'subtotal': prc['y1'][i], **{k: v[i] for k, v in prc.items()}} for i, job in enumerate(jobs)]
+
+
+class _Writer:
+    def __init__(self, f, fmt):
+        self.f = f
+        self.csv = csv.DictWriter(f, OUT_COLS) if fmt == 'csv' else None
+        if self.csv:
+            self.csv.writeheader()
+
+    def write(self, res):
+        if self.csv:
+            self.csv.writerow(res)
+        else:
+            self.f.write(json.dumps(res) + '\n')
+
+
+def run(jobs, out, workers=None, window=2000, chunksize=200):
+    # Jobs are pulled one window at a time so that neither the input nor the
+    # pending results ever sit in memory all at once.
+    n = 0
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        while True:
+            chunk = list(islice(jobs, window))
+            if not chunk:
+                break
+            for results in ex.map(price_jobs, [chunk[i:i + chunksize] for i in range(0, len(chunk), chunksize)]):
+                for res in results:
+                    out.write(res)
+                n += len(results)
+            out.f.flush()
+    return n
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Re-price saved gutter jobs against the current rate card.')
+    p.add_argument('input', help='jobs file (.jsonl or .csv)')
+    p.add_argument('-o', '--output', help='results file (.jsonl or .csv); defaults to JSONL on stdout')
+    p.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    p.add_argument('--window', type=int, default=2000, help='jobs held in flight at once')
+    p.add_argument('--chunksize', type=int, default=200, help='jobs sent to a worker per task')
+    args = p.parse_args(argv)
+
+    f = open(args.output, 'w', newline='') if args.output else sys.stdout
+    fmt = 'csv' if args.output and args.output.endswith('.csv') else 'jsonl'
+    t = time.perf_counter()
+    try:
+        n = run(read_jobs(args.input), _Writer(f, fmt), args.workers, args.window, args.chunksize)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    dt = time.perf_counter() - t
+    print(f"priced {n} jobs in {dt:.2f}s ({n / dt if dt else 0:.1f} jobs/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
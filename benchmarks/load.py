@@ -0,0 +1,196 @@
+"""Concurrent-user load test for app.py.
+
+    python -m benchmarks.load                          # 1, 2, 4 and 8 users, 30 s each
+    python -m benchmarks.load --users 4,16 --duration 120 --think 2
+    python -m benchmarks.load --mode thread --save load.json
+
+Every simulated rep drives its own AppTest session through a quote, over
+and over: open the page, add rows to the gutters, leaders and guards
+editors, press Calculate, switch to the stucco tab and type wall
+dimensions, switch back, fill in the customer and press Generate PDF. Each
+step is one rerun, timed from the input to the end of the rerun, and is
+followed by a random think time. After Generate PDF the rep also waits for
+the PDF, which is reported separately because rendering runs off the rerun.
+
+``--mode process`` gives each user a worker process, like one container
+per CPU. ``--mode thread`` runs all users on threads of one worker
+process, as a single Streamlit server does, so reruns contend for one GIL.
+Workers warm up with one untimed quote and then start together.
+
+For each user count the report gives rerun latency percentiles, reruns per
+second across all users, PDF wait times and peak RSS. In process mode RSS is
+given for the largest worker and summed over workers; in thread mode it is
+for the one process.
+"""
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+USERS = (1, 2, 4, 8)
+PERCENTILES = (50, 95, 99)
+EDITORS = {'g_ed': ('gutters', 'Gutter Type'), 'l_ed': ('leaders', 'Leader Type'), 'gg_ed': ('guards', 'Guard Type')}
+ROWS = 3
+WALLS = 4
+
+
+class Rep:
+    """One simulated sales rep. ``quote`` walks through a whole quote, recording each rerun."""
+
+    def __init__(self, user, seed, think):
+        from catalog import get_catalog
+
+        self.rng = np.random.default_rng([seed, user])
+        self.user, self.think, self.items = user, think, get_catalog().by_category
+        self.samples, self.pdf, self.errors = [], [], []
+
+    def step(self, name, at):
+        t = time.perf_counter()
+        at.run()
+        self.samples.append((name, time.perf_counter() - t))
+        if name == 'generate_pdf' and 'pdf_job' in at.session_state:
+            at.session_state['pdf_job'][0].add_done_callback(lambda job: self.pdf.append(time.perf_counter() - t))
+        if at.exception:
+            self.errors.append(f"{name}: {at.exception[0].message}")
+        if self.think:
+            time.sleep(self.rng.exponential(self.think))
+
+    def quote(self, until=float('inf')):
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(str(ROOT / 'app.py'), default_timeout=120)
+        steps = self.steps(at)
+        for name in steps:
+            self.step(name, at)
+            if time.perf_counter() >= until:
+                break
+        else:
+            # The rep downloads the PDF before starting the next quote.
+            if 'pdf_job' in at.session_state:
+                at.session_state['pdf_job'][0].result()
+
+    def steps(self, at):
+        # Each step sets up one input and yields its name; ``quote`` reruns.
+        rng = self.rng
+        yield 'load'
+        # An editor's delta is what the browser sends for the rows changed
+        # since the last rerun; the app has already written earlier rows back.
+        for key, (category, col) in EDITORS.items():
+            for _ in range(ROWS):
+                row = {'Location': str(rng.choice(['FRONT', 'RIGHT', 'BACK', 'LEFT'])), col: str(rng.choice(self.items[category])),
+                       'LF': round(float(rng.uniform(5, 80)), 2)}
+                at.session_state[key] = {'edited_rows': {}, 'added_rows': [row], 'deleted_rows': []}
+                yield f'edit_{category}'
+        at.button(key='calc_g').click()
+        yield 'calculate'
+        at.session_state['service_tab'] = 'Stucco Painting'
+        yield 'tab_stucco'
+        for i in range(WALLS):
+            wall = {'Location': 'FRONT', 'Width': f"{rng.integers(8, 45)}'{rng.integers(0, 12)}\"", 'Height': str(rng.integers(8, 24))}
+            at.session_state['stucco_walls_ed'] = {'edited_rows': {i: wall}, 'added_rows': [], 'deleted_rows': []}
+            yield 'edit_walls'
+        at.session_state['service_tab'] = 'Gutters & Leaders'
+        yield 'tab_gutters'
+        for label, value in [('Customer Name', f"Load Test {self.user}"), ('Project Address', f"{rng.integers(1, 999)} Elm St"), ('Sales Representative', f"Rep {self.user}")]:
+            next(w for w in at.text_input if w.label == label).input(value)
+            yield 'customer'
+        next(b for b in at.button if b.label == 'Generate PDF').click()
+        yield 'generate_pdf'
+
+
+def _worker(users, seed, think, duration, barrier, results):
+    # Keep deprecation notices and bare-mode warnings out of the output.
+    for name in ('streamlit.deprecation_util', 'streamlit.runtime.scriptrunner_utils.script_run_context', 'streamlit.elements.widgets.data_editor'):
+        logging.getLogger(name).addFilter(lambda record: False)
+    Rep(users[0], seed, 0).quote()
+    reps = [Rep(u, seed, think) for u in users]
+    barrier.wait()
+    start = time.time()
+    until = time.perf_counter() + duration
+
+    def run(rep):
+        while time.perf_counter() < until:
+            rep.quote(until)
+
+    threads = [threading.Thread(target=run, args=(rep,)) for rep in reps]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    results.put({'start': start, 'end': time.time(), 'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+                 'samples': [s for r in reps for s in r.samples], 'pdf': [p for r in reps for p in r.pdf], 'errors': [e for r in reps for e in r.errors]})
+
+
+def _pct(values):
+    return {f'p{p}': float(np.percentile(values, p)) if len(values) else None for p in PERCENTILES}
+
+
+def run(n, mode, seed, think, duration):
+    ctx = mp.get_context('spawn')
+    groups = [[u] for u in range(n)] if mode == 'process' else [list(range(n))]
+    barrier, results = ctx.Barrier(len(groups)), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(g, seed, think, duration, barrier, results)) for g in groups]
+    for p in procs:
+        p.start()
+    # Collect before joining: a worker cannot exit while its result sits in the pipe.
+    out = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    samples = [s for o in out for s in o['samples']]
+    wall = max(o['end'] for o in out) - min(o['start'] for o in out)
+    steps = sorted({name for name, _ in samples})
+    rss = [o['rss'] for o in out]
+    return {'users': n, 'mode': mode, 'reruns': len(samples), 'seconds': wall, 'reruns_per_s': len(samples) / wall,
+            'latency': _pct([s for _, s in samples]), 'by_step': {k: _pct([s for name, s in samples if name == k]) for k in steps},
+            'pdf': {'count': sum(len(o['pdf']) for o in out), **_pct([p for o in out for p in o['pdf']])},
+            'rss_max': max(rss), 'rss_total': sum(rss), 'errors': [e for o in out for e in o['errors']][:20]}
+
+
+def _ms(v):
+    return f"{v * 1e3:8.1f}" if v is not None else '       -'
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Load-test app.py with concurrent simulated reps.')
+    p.add_argument('--users', default=','.join(map(str, USERS)), help='comma-separated user counts to run in turn')
+    p.add_argument('--mode', choices=('process', 'thread'), default='process', help='a worker process per user, or one process for all')
+    p.add_argument('--duration', type=float, default=30, help='seconds of timed load per user count')
+    p.add_argument('--think', type=float, default=1.0, help='mean think time between steps, in seconds')
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--save', help='write results as JSON')
+    args = p.parse_args(argv)
+    try:
+        counts = [int(u) for u in args.users.split(',') if u]
+    except ValueError:
+        p.error('--users takes comma-separated integers')
+
+    print(f"{'users':>5} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'pdf p95':>8} {'rss max':>8} {'rss sum':>8}", file=sys.stderr)
+    results = []
+    for n in counts:
+        r = run(n, args.mode, args.seed, args.think, args.duration)
+        results.append(r)
+        lat = r['latency']
+        print(f"{n:>5} {r['reruns']:>7} {r['reruns_per_s']:>8.1f} {_ms(lat['p50'])} {_ms(lat['p95'])} {_ms(lat['p99'])} {_ms(r['pdf']['p95'])} "
+              f"{r['rss_max'] / 2**20:>6.0f}MB {r['rss_total'] / 2**20:>6.0f}MB", file=sys.stderr)
+        for e in r['errors']:
+            print(f"      error: {e}", file=sys.stderr)
+    if args.save:
+        meta = {'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'python': platform.python_version(), 'machine': platform.machine(),
+                'cpus': os.cpu_count(), 'mode': args.mode, 'duration': args.duration, 'think': args.think, 'seed': args.seed}
+        Path(args.save).write_text(json.dumps({'meta': meta, 'results': results}, indent=2) + '\n')
+    return 1 if any(r['errors'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Performance benchmarks for the pricing engines, app reruns, PDF output and estimate store.
+
+    python -m benchmarks.run                        # run and print
+    python -m benchmarks.run --save baseline.json   # keep a baseline
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+
+Run from the repository root. Each benchmark reports the median and best
+seconds per call over several repeats. With --compare, any benchmark whose
+median grew by more than the threshold is flagged and the run exits 1.
+Concurrent-user load tests are run separately with ``python -m benchmarks.load``.
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import synth
+from catalog import get_catalog
+from memo import Memo
+from painting import painting_totals
+from pricing import calc_pricing, gutter_totals
+from scenarios import TYPES, matrix
+from stone import stone_totals
+from stucco import stucco_totals
+
+ROOT = Path(__file__).resolve().parents[1]
+ROWS = (10, 100, 1000, 10000)
+GROUPS = ('engines', 'app', 'pdf', 'store', 'startup')
+SAVED = 20000
+
+
+def timeit(fn, repeat=5, min_time=0.05):
+    fn()
+    number = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        dt = time.perf_counter() - t
+        if dt >= min_time or number >= 100000:
+            break
+        number *= 10 if dt < min_time / 10 else 2
+    times = [dt / number]
+    for _ in range(repeat - 1):
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - t) / number)
+    return {'median': statistics.median(times), 'best': min(times), 'number': number, 'repeat': repeat}
+
+
+def engine_benches(seed):
+    yield 'calc_pricing', lambda: calc_pricing(12345.67, True, True)
+    # One house as measured: a few rows per table, so per-call overhead and
+    # not row count sets the time.
+    house = {c: df.head(k) for (c, df), k in zip(synth.gutter_measurements(8, seed).items(), (8, 6, 2))}
+    yield 'calc_totals_gutters[house]', lambda: gutter_totals(house)
+    for n in ROWS:
+        m = synth.gutter_measurements(n, seed)
+        yield f'calc_totals_gutters[{n}]', lambda m=m: gutter_totals(m)
+        yield f'gutters+calc_pricing[{n}]', lambda m=m: calc_pricing(gutter_totals(m)[1])
+        tots, sub = gutter_totals(m)
+        yield f'scenario_matrix[{n}]', lambda t=tots, s=sub: matrix(t, s, TYPES, (False, True), (False, True))
+        stone = synth.stone_job(n, seed)
+        yield f'stone_totals[{n}]', lambda j=stone: stone_totals(*j, zone=1)
+        stucco = synth.stucco_job(n, seed)
+        yield f'stucco_totals[{n}]', lambda j=stucco: stucco_totals(*j, outs=120)
+        painting = synth.painting_job(n, seed)
+        yield f'painting_totals[{n}]', lambda j=painting: painting_totals(*j, outs=80, substrate=2)
+        # A rerun with nothing edited: hash every table, hit the service node.
+        tables, memo = {**stucco[0], **stucco[1]}, Memo()
+        yield f'memo_hit[stucco,{n}]', lambda t=tables, m=memo: m.totals('stucco', t, get_catalog(), outs=120)
+
+
+def app_benches(seed):
+    from streamlit.testing.v1 import AppTest
+
+    # Keep deprecation notices and bare-mode warnings out of the timing output.
+    for name in ('streamlit.deprecation_util', 'streamlit.runtime.scriptrunner_utils.script_run_context'):
+        logging.getLogger(name).addFilter(lambda record: False)
+    # Only the open tab runs, so a populated estimate is timed once per tab.
+    cases = [('app_rerun[empty]', {})] + [(f'app_rerun[{tab}]', {**synth.session_state(seed), 'service_tab': label}) for tab, label in synth.TABS.items()]
+    for name, state in cases:
+        at = AppTest.from_file(str(ROOT / 'app.py'), default_timeout=120)
+        for k, v in state.items():
+            at.session_state[k] = v
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].message}")
+        yield name, at.run
+
+
+def pdf_benches(seed):
+    from pdf import render_estimate
+
+    est = synth.estimate(seed)
+    yield 'render_estimate[four_services]', lambda: render_estimate(est)
+
+
+def store_benches(seed):
+    import store
+
+    # A throwaway database of SAVED quotes, bulk-loaded through the writer's row
+    # encoding. The searches are the office's: a name prefix, a rep, no filter.
+    store.PATH = str(Path(tempfile.mkdtemp()) / 'estimates.db')
+    est, state = synth.estimate(seed), {'tables': {'stone_measurements': synth.stone_job(12, seed)[0]}, 'options': {'stone_zone': 1}}
+    rng = synth._rng(seed)
+    recs = [{'customer': {'customer_name': f"Customer {i:05d}", 'project_address': f"{rng.integers(1, 999)} Elm St", 'sales_rep': f"Rep {i % 25}"},
+             'sections': est['sections'], 'state': state, 'created': f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}T09:{i % 60:02d}:00"} for i in range(SAVED)]
+    with store.connection() as conn:
+        conn.execute('BEGIN')
+        conn.executemany(store.INSERT, map(store._row, recs))
+        conn.execute('COMMIT')
+    yield f'store_search[name,{SAVED}]', lambda: store.search('customer 123')
+    yield f'store_search[rep,{SAVED}]', lambda: store.search('rep 7')
+    yield f'store_search[recent,{SAVED}]', lambda: store.search()
+    yield 'store_load', lambda: store.load(SAVED // 2)
+    yield 'store_save[enqueue]', lambda: store.save(recs[0])
+    # One month of the saved quotes, as the office exports them.
+    import export
+    out = str(Path(store.PATH).with_name('quotes.parquet'))
+    yield f'store_export[parquet,{SAVED // 12}]', lambda: export.export(out, '2025-01-01', '2025-02-01')
+
+
+def startup_results(repeat):
+    # Every sample needs a fresh interpreter, so these are timed inside
+    # benchmarks.startup rather than with timeit.
+    samples = {}
+    for mode in ('imports', 'render'):
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.startup', mode], cwd=ROOT, capture_output=True, text=True, check=True)
+            for k, v in json.loads(out.stdout).items():
+                if isinstance(v, bool):
+                    print(f"startup {mode}: {k}={v}", file=sys.stderr)
+                else:
+                    samples.setdefault(f'startup[{k}]', []).append(v)
+    return {name: {'median': statistics.median(v), 'best': min(v), 'number': 1, 'repeat': repeat} for name, v in samples.items()}
+
+
+def run(groups, seed, repeat):
+    benches = {'engines': engine_benches, 'app': app_benches, 'pdf': pdf_benches, 'store': store_benches}
+    results = {}
+    for g in groups:
+        if g == 'startup':
+            results.update(startup_results(repeat))
+            for name in (k for k in results if k.startswith('startup[')):
+                print(f"{name:<36} {results[name]['median'] * 1e3:10.3f} ms  (best {results[name]['best'] * 1e3:.3f} ms)", file=sys.stderr)
+            continue
+        for name, fn in benches[g](seed):
+            results[name] = timeit(fn, repeat, min_time=0.5 if g == 'app' else 0.05)
+            print(f"{name:<36} {results[name]['median'] * 1e3:10.3f} ms  (best {results[name]['best'] * 1e3:.3f} ms, n={results[name]['number']})", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    slow = []
+    for name, r in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        ratio = r['median'] / old['median']
+        flag = ratio > 1 + threshold
+        if flag:
+            slow.append(name)
+        print(f"{name:<36} {old['median'] * 1e3:10.3f} -> {r['median'] * 1e3:10.3f} ms  {ratio:6.2f}x{'  SLOWER' if flag else ''}")
+    return slow
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Run the pricing-app benchmarks.')
+    p.add_argument('--only', default=','.join(GROUPS), help=f"comma-separated groups ({', '.join(GROUPS)})")
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--repeat', type=int, default=5)
+    p.add_argument('--save', help='write results as a JSON baseline')
+    p.add_argument('--compare', help='baseline JSON to compare against')
+    p.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown before flagging (0.2 = 20%%)')
+    args = p.parse_args(argv)
+
+    groups = [g for g in args.only.split(',') if g]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        p.error(f"unknown group(s): {', '.join(sorted(unknown))}")
+    results = run(groups, args.seed, args.repeat)
+    doc = {'meta': {'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'python': platform.python_version(),
+                    'machine': platform.machine(), 'seed': args.seed, 'repeat': args.repeat},
+           'results': results}
+    if args.save:
+        Path(args.save).write_text(json.dumps(doc, indent=2) + '\n')
+    if args.compare:
+        slow = compare(results, json.loads(Path(args.compare).read_text())['results'], args.threshold)
+        if slow:
+            print(f"{len(slow)} benchmark(s) slower than baseline by more than {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
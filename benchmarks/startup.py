@@ -0,0 +1,61 @@
+"""Cold-start probe, run in a fresh interpreter by ``benchmarks.run``.
+
+    python -m benchmarks.startup imports   # time app.py's top-level imports
+    python -m benchmarks.startup render    # time to first render of app.py
+
+Prints one JSON object of seconds. ``render`` also reports a warm rerun and
+whether reportlab was loaded by the first render.
+"""
+import ast
+import importlib
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def app_imports():
+    names = []
+    for node in ast.parse((ROOT / 'app.py').read_text()).body:
+        if isinstance(node, ast.Import):
+            names += [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names.append(node.module)
+    return [n for n in dict.fromkeys(names) if n.split('.')[0] != 'streamlit']
+
+
+def imports():
+    t = time.perf_counter()
+    import streamlit  # noqa: F401
+    out = {'import_streamlit': time.perf_counter() - t}
+    t = time.perf_counter()
+    for name in app_imports():
+        importlib.import_module(name)
+    out['import_app_modules'] = time.perf_counter() - t
+    return out
+
+
+def render():
+    from streamlit.testing.v1 import AppTest
+
+    for name in ('streamlit.deprecation_util', 'streamlit.runtime.scriptrunner_utils.script_run_context'):
+        logging.getLogger(name).addFilter(lambda record: False)
+    at = AppTest.from_file(str(ROOT / 'app.py'), default_timeout=120)
+    t = time.perf_counter()
+    at.run()
+    out = {'first_render': time.perf_counter() - t}
+    t = time.perf_counter()
+    at.run()
+    out['warm_rerun'] = time.perf_counter() - t
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    out['reportlab_loaded'] = 'reportlab' in sys.modules
+    return out
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(ROOT))
+    print(json.dumps({'imports': imports, 'render': render}[sys.argv[1]]()))
@@ -0,0 +1,119 @@
+"""Seeded synthetic jobs for the benchmarks.
+
+Every generator takes a ``seed`` so two runs price exactly the same jobs.
+Tables are built from the strings reps type and then cast to the typed grid
+columns the app keeps in session state.
+"""
+import numpy as np
+import pandas as pd
+
+import grids
+from catalog import get_catalog
+from estimate import combine, gutter_lines, sections
+from painting import painting_totals
+from pricing import GUTTER_COLS, gutter_totals
+from stone import stone_totals
+from stucco import stucco_totals
+
+
+TABS = {'gutters': 'Gutters & Leaders', 'stone': 'Stone Veneer', 'stucco': 'Stucco Painting', 'painting': 'House Painting'}
+
+
+def _rng(seed):
+    return np.random.default_rng(seed)
+
+
+def _num_strs(rng, n, lo, hi, decimals=1):
+    return [f"{v:.{decimals}f}" for v in rng.uniform(lo, hi, n)]
+
+
+def _lf_table(rng, n, col='LF', lo=2, hi=60):
+    return pd.DataFrame({'Location': rng.choice(grids.SIDES, n), col: _num_strs(rng, n, lo, hi)})
+
+
+def _count_table(rng, n, col):
+    return pd.DataFrame({'Location': rng.choice(grids.SIDES, n), col: [str(v) for v in rng.integers(1, 12, n)]})
+
+
+def _walls(rng, n):
+    return pd.DataFrame({'Location': rng.choice(grids.SIDES, n), 'Width': _num_strs(rng, n, 8, 45), 'x': 'x',
+                         'Height': _num_strs(rng, n, 6, 24), 'Total SF': ''})
+
+
+def _typed(meas):
+    return {t: grids.typed(df, t, get_catalog()) for t, df in meas.items()}
+
+
+def gutter_measurements(n, seed=0):
+    cat = get_catalog()
+    rng = _rng(seed)
+    return _typed({c: pd.DataFrame({'Location': rng.choice(grids.SIDES, n), col: rng.choice(cat.by_category[c], n), 'LF': rng.uniform(5, 80, n).round(2)})
+                   for c, col in GUTTER_COLS.items()})
+
+
+def stone_job(n=12, seed=0):
+    rng = _rng(seed)
+    meas = {
+        'flats': pd.DataFrame({'Location': rng.choice(grids.SIDES, n), 'Width': _num_strs(rng, n, 4, 30), 'Height': _num_strs(rng, n, 2, 10), 'Total SF': ''}),
+        'corners': _lf_table(rng, n, lo=2, hi=20),
+        'sills': _lf_table(rng, n, lo=2, hi=12),
+        'outs': pd.DataFrame({'Location': rng.choice(grids.SIDES, max(n // 2, 1)), 'Width': _num_strs(rng, max(n // 2, 1), 2, 6),
+                              'Height': _num_strs(rng, max(n // 2, 1), 2, 7), 'Total': ''}),
+    }
+    meas = _typed(meas)
+    pricing = get_catalog().new_pricing('stone')
+    pricing['demolition'].loc[0, 'Per Square'] = str(int(rng.integers(2, 25)))
+    pricing['misc'].loc[1, 'SF/LF/Q'] = str(int(rng.integers(4, 20)))
+    return meas, pricing
+
+
+def stucco_job(n=28, seed=0):
+    rng = _rng(seed)
+    meas = {'walls': _walls(rng, n), 'window_trim': _lf_table(rng, 8), 'door_trim': _lf_table(rng, 8), 'soffit': _lf_table(rng, 8),
+            'fascia': _lf_table(rng, 8), 'quions': _count_table(rng, 8, 'Quantity'), 'other_trim': _count_table(rng, 8, 'Quantity')}
+    meas = _typed(meas)
+    pricing = get_catalog().new_pricing('stucco')
+    pricing['caulking'].loc[0, 'LF'] = str(int(rng.integers(20, 200)))
+    pricing['misc'].loc[2, 'Quantity'] = str(int(rng.integers(1, 6)))
+    return meas, pricing
+
+
+def painting_job(n=28, seed=0):
+    rng = _rng(seed)
+    meas = {'walls': _walls(rng, n), 'window_trim': _count_table(rng, 8, 'Openings'), 'door_trim': _count_table(rng, 8, 'Openings'),
+            'soffit': _lf_table(rng, 8), 'fascia': _lf_table(rng, 8), 'entry_doors': _count_table(rng, 8, 'Openings'),
+            'garage_doors': _count_table(rng, 8, 'Openings')}
+    meas = _typed(meas)
+    pricing = get_catalog().new_pricing('painting')
+    pricing['misc'].loc[10, 'Quantity'] = '1'
+    return meas, pricing
+
+
+def session_state(seed=0, gutter_rows=12):
+    """Session state for a fully populated four-tab estimate.
+
+    Set ``service_tab`` to one of the TABS labels to pick the open tab.
+    """
+    stone_meas, stone_pricing = stone_job(seed=seed)
+    stucco_meas, stucco_pricing = stucco_job(seed=seed + 1)
+    painting_meas, painting_pricing = painting_job(seed=seed + 2)
+    return {
+        'measurements': gutter_measurements(gutter_rows, seed),
+        'stone_measurements': stone_meas, 'stone_pricing': stone_pricing,
+        'stucco_measurements': stucco_meas, 'stucco_pricing': stucco_pricing,
+        'painting_measurements': painting_meas, 'painting_pricing': painting_pricing,
+        'customer_info': {'customer_name': 'Benchmark Customer', 'project_address': '1 Synthetic Way, Trenton NJ', 'sales_rep': 'Bench'},
+        'stucco_front_outs': '(120)', 'painting_rear_outs': '80', 'stone_zone': 1, 'p_substrate': 2, 'st_rig': True, 'p_rep': True,
+    }
+
+
+def estimate(seed=0):
+    """Plain-data four-service estimate, as handed to pdf.render_estimate."""
+    ss = session_state(seed)
+    parts = {
+        'gutters': gutter_lines(gutter_totals(ss['measurements'])[0]),
+        'stone': stone_totals(ss['stone_measurements'], ss['stone_pricing'], ss['stone_zone'])[0],
+        'stucco': stucco_totals(ss['stucco_measurements'], ss['stucco_pricing'], 120)[0],
+        'painting': painting_totals(ss['painting_measurements'], ss['painting_pricing'], 80, ss['p_substrate'])[0],
+    }
+    return {'customer': ss['customer_info'], 'date': '01/02/2026', 'sections': sections(*combine(parts, ss['p_rep'], ss['st_rig']))}
@@ -0,0 +1,481 @@
+"""The rate card and the indexed catalog built from it.
+
+The constants below are the built-in rate card. In production the card is
+read from ``ratecard.json`` (or the file named by PRICING_RATECARD), which
+has the same tables under lower-case keys plus a ``version`` string:
+
+    {"version": "2026.10", "gutters": {...}, "loxon_above": [[...], ...], ...}
+
+``get_catalog`` hands out the catalog for the file as it is now. A cheap
+stat per call notices a new mtime or size. The file is then re-read, and
+re-parsed only if its hash changed. The new catalog replaces the old one in
+a single reference swap, so a rerun that holds a catalog keeps a consistent
+card to the end. A file that fails to parse or does not match the built-in
+card's shape is logged and ignored, and the last good card stays live.
+``Catalog.version`` is the file's version plus a short content hash.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+SERVICE_DATA = {
+    'gutters': {
+        'name': 'Gutters and Leaders',
+        'items': {
+            'Gutter 5" white': {'price': 13, 'category': 'gutters'},
+            'Gutter 5" all colors': {'price': 15, 'category': 'gutters'},
+            'Gutter 6" white': {'price': 18, 'category': 'gutters'},
+            'Gutter 6" all colors': {'price': 19, 'category': 'gutters'},
+            'Extra Gauge (0.032 gauge)': {'price': 1, 'category': 'gutters'},
+            'Leaders 2x3 white': {'price': 12, 'category': 'leaders'},
+            'Leaders 2x3 all colors': {'price': 13, 'category': 'leaders'},
+            'Leader 2x3 white - PVC': {'price': 18, 'category': 'leaders'},
+            'Leaders 3x4 white': {'price': 15, 'category': 'leaders'},
+            'Leaders 3x4 all colors': {'price': 16, 'category': 'leaders'},
+            'Leader 3" Round Corrugated - White': {'price': 47, 'category': 'leaders'},
+            'Extra Gauge (0.032 gauge) Leader': {'price': 1, 'category': 'leaders'},
+            'Shur-flow 5" (white)': {'price': 15, 'category': 'guards'},
+            'Shur-flow 5" (black or aluminum)': {'price': 16, 'category': 'guards'},
+            'Shur-flow 6" (white)': {'price': 16, 'category': 'guards'},
+            'Shur-flow 6" (black or aluminum)': {'price': 18, 'category': 'guards'},
+            'Screen 5"': {'price': 10, 'category': 'guards'},
+            'Screen 6"': {'price': 12, 'category': 'guards'},
+            'Leafshelter 6" - White': {'price': 18, 'category': 'guards'},
+            'Leafshelter 6" - All Colors': {'price': 21, 'category': 'guards'},
+            'Strap Hangers per LF': {'price': 4, 'category': 'guards'}
+        }
+    }
+}
+
+# Gutter job minimums: "combined" when the job also has another service.
+GUTTER_MINIMUMS = {'combined': 650, 'stand_alone': 1150}
+
+GUTTER_TERMS = "50% deposit required | JOB MINIMUM: ${combined:,.0f} (combined) / ${stand_alone:,.0f} (stand-alone)"
+
+STONE_GUIDELINES = [
+    'Measurements must be tip to tip',
+    'Brick returns at windows/doors, must include in SF & LF',
+    'New treads/cap required if existing overhang is not a min of 2 1',
+    'Charge wrap corner fee if turning into vinyl siding or wood sidin',
+    'Chimney caps required when stone on chimneys',
+    'Chimney scaffolding required if stone on chimney'
+]
+
+STONE_MINIMUMS = [
+    ['All counties excluding below', '$7,500'],
+    ['Zone (1): Sussex, Warren, Hunterdon, Mercer', '$8,500'],
+    ['Zone (2): Ocean, Burlington, Camden', '$9,500']
+]
+
+STUCCO_MINIMUMS = [
+    ['LOXON', '$4,200'],
+    ['CLEAR SEALER', '$3,500'],
+    ['WOODPECKER HOLES (INCLUDES UP TO 6 HOLES) ADD $500 PER HOLE', '$3,500'],
+    ['BCMA', '$4,200'],
+    ['SPOT POINTING', '$4,900'],
+    ['FULL POINTING', '$5,600'],
+    ['CAULKING', '$5,600']
+]
+
+STONE_DEMOLITION = [
+    ['Remove vinyl or aluminum siding', '', 237],
+    ['Remove wood siding (clapboard)', '', 267],
+    ['Remove wood siding (wood shake)', '', 297],
+    ['Remove EIFS up to 2" only', '', 400]
+]
+
+STONE_DEBRIS = [
+    ['Debris removal under 4 squares (REQUIRED even if no demo)', '', 830],
+    ['10 yard dumpster (removal from 4 to 10 squares)', '', 1542],
+    ['20 yard dumpster (removal from 11 to 20 squares)', '', 1868]
+]
+
+STONE_MISC = [
+    ['Wrap Corner 4" (Wood or Vinyl Siding)', "Per 8' Corner", '', 297],
+    ['Limestone Treads (up to 12" Deep)', 'LF', '', 128],
+    ['Limestone Treads (up to 14" Deep)', 'LF', '', 144],
+    ['Cement Pad (Up to 20sf) Demo/New', 'Per Item', '', 890],
+    ['Chimney Scaffolding Fee', 'Full chimney or on roof', '', 741],
+    ['Stainless Steel Chimney Cover', 'Per Item', '', 1605],
+    ['1/2" Plywood Replacement', 'Per Item', '', 374]
+]
+
+STONE_ITEMS = [
+    ['Stone Flats (1/2" joint only)', 'SF', '', 58],
+    ['Stone Corners', 'LF', '', 32],
+    ['Chiseled Stone Sills', 'LF', '', 26]
+]
+
+LOXON_ABOVE = [
+    ['Includes ladders and access', '200 - 499', '', 14.27],
+    ['Includes powerwash of all work areas', '500 - 999', '', 13.00],
+    ['Crack repair up to 50 linear ft (1" or less)', '1000 - 1699', '', 12.45],
+    ['Apply Two Coats of Loxon XP', '1700 - 2999', '', 11.78],
+    ['Loxon will be rolled or sprayed at our discretion', '3000 - 4499', '', 11.38],
+    ['Wall texture will remain the same', 'Above 4500', '', 11.09]
+]
+
+LOXON_BELOW = [
+    ['Does not include ladders, all ground work', '200 - 499', '', 9.69],
+    ['Includes powerwash of all work areas', '500 - 999', '', 9.11],
+    ['Crack repair up to 50 linear ft (1" or less)', '1000 - 1699', '', 8.73],
+    ['Apply Two Coats of Loxon XP', '1700 - 2999', '', 8.24],
+    ['Loxon will be rolled or sprayed at our discretion', '3000 - 4499', '', 7.95],
+    ['Wall texture will remain the same', 'Above 4500', '', 7.75]
+]
+
+LOXON_TRIM = [
+    ['Two coats of Loxon XP over stucco window/door trim (up to 6")', 'Per LF', '', 7.25],
+    ['Two coats of Loxon XP over stucco soffit (up to 12")', 'Per LF', '', 11.67],
+    ['Two coats of Loxon XP over stucco fascia (up to 8")', 'Per LF', '', 8.15],
+    ['Apply two coats of Loxon XP over single side quion', 'Per Side', '', 11.67]
+]
+
+CAULKING = [
+    ['Caulk only (no raking) - up to 3/4"', '', 8.36],
+    ['Caulk and install backer rod (no raking) - up to 3/4"', '', 11.17],
+    ['Rake out and caulk only - up to 3/4"', '', 12.54],
+    ['Rake out and install backer rod - up to 3/4"', '', 15.32]
+]
+
+STUCCO_MISC = [
+    ['EIFS Repair', 'Per SF', '', 60],
+    ['BCMA (Fiberglass, Basecoat, Acrylic Stucco)', 'Per SF', '', 17.59],
+    ['Remove and Re-Install Existing Shutters', 'Per Pair', '', 145],
+    ['Remove, Paint and Re-Install Shutters (per pair)', 'Per Pair', '', 290],
+    ['Stainless Steel Chimney Cover', 'Per Item', '', 1509],
+    ['Plywood (demo, debris, install 1 sheet of plywood) 32 sf', 'Per Item', '', 439],
+    ['Remove and Re-Install Existing Gutters', 'Per LF', '', 6],
+    ['Additional Rigging (For Caulking Only Projects)', 'Per Side', '', 435],
+    ['Clear Sealer, Ladders, Powerwash', 'Per SF', '', 7],
+    ['Additional Heavy Duty Powerwash', 'Per SF', '', 2],
+    ['Additional stucco crack repair above 50 lf (1" or less)', 'Per LF', '', 7],
+    ['Spot Point Brick    (* See rules page)', 'Per SF', '', 29],
+    ['Full Cut and Re-Point (Under 500sf)', 'Per SF', '', 29]
+]
+
+PAINTING_WALLS = [
+    ['Vinyl and Aluminum ---- (Use vinyl safe colors for vinyl only)', '', 8.06, ''],
+    ['Wood Clapboard ---- (20% sand and spot prime)', '', 9.28, ''],
+    ['Wood Clapboard ---- (Full sanding only)', '', 11.5, ''],
+    ['Wood Shake ---- (20% sand and spot prime)', '', 10.02, ''],
+    ['Wood Shake ---- (Full sanding only)', '', 12.19, '']
+]
+
+PAINTING_TRIM = [
+    ['Window trim ---- (up to 4in wide)', 'Per Opening', '', 61.48, ''],
+    ['Door trim ---- (up to 4in wide)', 'Per Opening', '', 61.48, ''],
+    ['Fascia for frieze board trim ---- (up to 6in wide)', 'Per LF', '', 6.36, ''],
+    ['Soffit - Non Vented ---- (up to 12in deep)', 'Per LF', '', 8.48, ''],
+    ['Remove and re-install existing shutters', 'Per Pair', '', 77.38, ''],
+    ['Remove, paint and re-install existing shutters', 'Per Pair', '', 106.0, ''],
+    ['Single front entry door ---- (wood surface only)', 'Per Opening', '', 242.0, ''],
+    ['Garage doors ---- (wood surface only)', 'Per Opening', '', 530.0, '']
+]
+
+PAINTING_MISC = [
+    ['Remove / replace (1) sheet of plywood ---- (up to 32sf)', '', '', 316.94, ''],
+    ['Remove / replace wood siding ---- (up to 8 sq exposure)', 'Per 12ft Piece', '', 320.12, ''],
+    ['Remove / replace aluminum siding ---- (up to 8in exposure)', 'Per 12ft Piece', '', 320.12, ''],
+    ['Remove / replace wood trim ---- (2/4in x 3ft x 12ft)', 'Per 16ft Piece', '', 151.58, ''],
+    ['Remove / replace wood clapboard ---- (1/2in x 8in x 16ft)', 'Per 16ft Piece', '', 338.14, ''],
+    ['Remove / replace wood shake ---- (up to 12in Exposure)', 'Per 1/2 Square', '', 647.66, ''],
+    ['Remove / re-install existing gutters', 'Per LF', '', 4.24, ''],
+    ['Additional powerwash', 'Per SF', '', 1.59, ''],
+    ['Caulk only (no raking) ---- (up to 1/2in)', 'Per LF', '', 8.48, ''],
+    ['Rake out and caulk only ---- (up to 1/2in)', 'Per LF', '', 12.72, ''],
+    ['Paint samples ---- (includes 1 color sample)', 'Per Item', '', 82.68, '']
+]
+
+# Stone business rules, declared as data and compiled once into lookup
+# arrays by compile_stone_rules:
+#   round_even - STONE_LF_TABLES whose LF total is rounded up to the next
+#                even foot
+#   debris     - (floor in squares, STONE_DEBRIS row); past the last floor,
+#                one more of the largest dumpster per ``debris_cap`` squares
+#   minimums   - job minimum per STONE_MINIMUMS zone row
+STONE_LF_TABLES = ('corners', 'sills')
+STONE_RULES = {
+    'round_even': ['corners', 'sills'],
+    'debris': [[0, 0], [4, 1], [11, 2]],
+    'debris_cap': 20,
+    'minimums': [7500, 8500, 9500],
+}
+
+# Rate-card tables by card key.
+CARD_TABLES = {
+    'stone_minimums': STONE_MINIMUMS,
+    'stucco_minimums': STUCCO_MINIMUMS,
+    'stone_demolition': STONE_DEMOLITION,
+    'stone_debris': STONE_DEBRIS,
+    'stone_misc': STONE_MISC,
+    'stone_items': STONE_ITEMS,
+    'loxon_above': LOXON_ABOVE,
+    'loxon_below': LOXON_BELOW,
+    'loxon_trim': LOXON_TRIM,
+    'caulking': CAULKING,
+    'stucco_misc': STUCCO_MISC,
+    'painting_walls': PAINTING_WALLS,
+    'painting_trim': PAINTING_TRIM,
+    'painting_misc': PAINTING_MISC,
+}
+
+BUILTIN_CARD = {'version': 'builtin', 'gutters': SERVICE_DATA['gutters']['items'], **CARD_TABLES, 'stone_rules': STONE_RULES, 'gutter_minimums': GUTTER_MINIMUMS}
+
+RATECARD = os.environ.get('PRICING_RATECARD', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ratecard.json'))
+
+DISPLAY_TABLES = {
+    'stone_items': ('stone_items', ['Description', 'SF/LF/Q', 'Price', 'Sub-Total']),
+    'stone_debris': ('stone_debris', ['Description', 'Quantity', 'Price']),
+    'stone_minimums': ('stone_minimums', ['Description', 'AMOUNT']),
+    'loxon_above': ('loxon_above', ['Description', 'SF RANGE', 'SF', 'PRICE']),
+    'loxon_below': ('loxon_below', ['Description', 'SF RANGE', 'SF', 'PRICE']),
+    'loxon_trim': ('loxon_trim', ['Description', '', 'PRICE', 'TOTAL']),
+    'stucco_minimums': ('stucco_minimums', ['Service', 'Amount']),
+    'painting_walls': ('painting_walls', ['Description', 'Total SF', 'Price Per SF', 'TOTAL']),
+    'painting_trim': ('painting_trim', ['Description', '', 'Total Qty', 'Price Per Unit', 'TOTAL']),
+}
+
+EDITABLE_TABLES = {
+    'stone': {
+        'demolition': ('stone_demolition', ['Description', 'Per Square', 'Price']),
+        'misc': ('stone_misc', ['Description', 'Unit', 'SF/LF/Q', 'Price']),
+    },
+    'stucco': {
+        'caulking': ('caulking', ['Description', 'LF', 'PRICE']),
+        'misc': ('stucco_misc', ['Description', 'Unit', 'Quantity', 'PRICE']),
+    },
+    'painting': {
+        'misc': ('painting_misc', ['Description', '', 'Quantity', 'Price Per Unit', 'TOTAL']),
+    },
+}
+
+log = logging.getLogger(__name__)
+
+
+def _tier_floor(label):
+    # '200 - 499' -> 200, 'Above 4500' -> 4500
+    return int(re.search(r'\d+', label).group())
+
+
+def _amount(text):
+    # '$4,200' -> 4200.0
+    m = re.fullmatch(r'\$?([\d,]+(?:\.\d+)?)', text.strip()) if isinstance(text, str) else None
+    if not m:
+        raise ValueError(f"{text!r} is not a dollar amount")
+    return float(m.group(1).replace(',', ''))
+
+
+def _frozen(a):
+    a = np.asarray(a)
+    a.flags.writeable = False
+    return a
+
+
+@dataclass(frozen=True)
+class StoneRules:
+    round_even: frozenset
+    debris_floors: np.ndarray
+    debris_rows: np.ndarray
+    debris_cap: int
+    minimums: np.ndarray
+
+
+def compile_stone_rules(rules):
+    debris = sorted(rules['debris'])
+    return StoneRules(
+        round_even=frozenset(rules['round_even']),
+        debris_floors=_frozen([f for f, _ in debris]),
+        debris_rows=_frozen([r for _, r in debris]),
+        debris_cap=int(rules['debris_cap']),
+        minimums=_frozen(rules['minimums']),
+    )
+
+
+def _number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool) and v >= 0
+
+
+def validate_card(card):
+    """Raise ValueError unless ``card`` has the built-in card's shape.
+
+    The engines index rate rows by position, so every table must keep its
+    row count and row width, and a number must stay a non-negative number.
+    """
+    if not isinstance(card, dict) or not isinstance(card.get('version'), str):
+        raise ValueError("rate card needs a string 'version'")
+    items = card.get('gutters')
+    if not isinstance(items, dict) or not all(isinstance(v, dict) and _number(v.get('price')) for v in items.values()):
+        raise ValueError("'gutters' must map item names to {'price', 'category'}")
+    categories = {v['category'] for v in BUILTIN_CARD['gutters'].values()}
+    if {v.get('category') for v in items.values()} != categories:
+        raise ValueError(f"gutter item categories must be exactly {sorted(categories)}")
+    for key, rows in CARD_TABLES.items():
+        got = card.get(key)
+        if not isinstance(got, list) or len(got) != len(rows):
+            raise ValueError(f"'{key}' must have {len(rows)} rows")
+        for i, (want, row) in enumerate(zip(rows, got)):
+            if not isinstance(row, list) or len(row) != len(want):
+                raise ValueError(f"'{key}' row {i} must have {len(want)} fields")
+            for w, v in zip(want, row):
+                if _number(w) != _number(v) or (not _number(w) and not isinstance(v, str)):
+                    raise ValueError(f"'{key}' row {i} field {v!r} must be {'a non-negative number' if _number(w) else 'text'}")
+    for row in card['stucco_minimums']:
+        _amount(row[1])
+    rules = card.get('stone_rules')
+    if not isinstance(rules, dict) or rules.keys() != STONE_RULES.keys():
+        raise ValueError(f"'stone_rules' must have {sorted(STONE_RULES)}")
+    if not isinstance(rules['round_even'], list) or not set(rules['round_even']) <= set(STONE_LF_TABLES):
+        raise ValueError(f"'stone_rules' round_even must list tables from {list(STONE_LF_TABLES)}")
+    # A debris tier names a stone_debris row, which the engine indexes mid-quote.
+    debris = rules['debris']
+    if (not isinstance(debris, list) or not debris
+            or not all(isinstance(t, list) and len(t) == 2 and _number(t[0]) and type(t[1]) is int and 0 <= t[1] < len(STONE_DEBRIS)
+                       for t in debris)):
+        raise ValueError(f"'stone_rules' debris must be [floor, row] pairs with a row from 0 to {len(STONE_DEBRIS) - 1}")
+    if type(rules['debris_cap']) is not int or rules['debris_cap'] <= 0:
+        raise ValueError("'stone_rules' debris_cap must be a positive whole number of squares")
+    mins = rules['minimums']
+    if not isinstance(mins, list) or len(mins) != len(STONE_MINIMUMS) or not all(map(_number, mins)):
+        raise ValueError("'stone_rules' minimums must give a non-negative amount per zone")
+    # Optional: cards written before gutter minimums were on the card use the built-in ones.
+    mins = card.get('gutter_minimums', GUTTER_MINIMUMS)
+    if not isinstance(mins, dict) or mins.keys() != GUTTER_MINIMUMS.keys() or not all(map(_number, mins.values())):
+        raise ValueError(f"'gutter_minimums' must give a non-negative amount for each of {sorted(GUTTER_MINIMUMS)}")
+
+
+@dataclass(frozen=True)
+class Catalog:
+    version: str
+    tables: MappingProxyType
+    items: MappingProxyType
+    by_category: MappingProxyType
+    price: MappingProxyType
+    gutters: pd.DataFrame
+    gutter_tables: MappingProxyType
+    frames: MappingProxyType
+    editable: MappingProxyType
+    loxon_tiers: np.ndarray
+    loxon_rates: MappingProxyType
+    loxon_trim_rates: tuple
+    painting_wall_rates: tuple
+    painting_trim_rates: tuple
+    stone_item_rates: tuple
+    stone_debris_rates: np.ndarray
+    stone_rules: StoneRules
+    stucco_minimums: np.ndarray
+    gutter_minimums: MappingProxyType
+    gutter_terms: str
+
+    def new_pricing(self, service, current=None):
+        """Fresh copies of ``service``'s editable tables.
+
+        With ``current``, the session's tables are kept and only their rate
+        columns (the numeric ones) are taken from this card, so quantities a
+        rep typed survive a rate-card change.
+        """
+        fresh = {k: df.copy() for k, df in self.editable[service].items()}
+        for k, df in (current or {}).items():
+            if k in fresh and len(df) == len(fresh[k]):
+                fresh[k] = df.assign(**{c: fresh[k][c] for c in fresh[k].columns if pd.api.types.is_numeric_dtype(fresh[k][c])})
+        return fresh
+
+
+def build_catalog(card=None, version=None):
+    card = card or BUILTIN_CARD
+    tables = MappingProxyType({k: tuple(map(tuple, card[k])) for k in CARD_TABLES})
+    items = card['gutters']
+    gutter_minimums = card.get('gutter_minimums', GUTTER_MINIMUMS)
+    by_category = {}
+    for k, v in items.items():
+        by_category.setdefault(v['category'], []).append(k)
+    return Catalog(
+        version=version or card['version'],
+        tables=tables,
+        items=MappingProxyType({k: MappingProxyType(dict(v)) for k, v in items.items()}),
+        by_category=MappingProxyType({c: tuple(ks) for c, ks in by_category.items()}),
+        price=MappingProxyType({k: v['price'] for k, v in items.items()}),
+        gutters=pd.DataFrame([[k, v['category'], v['price']] for k, v in items.items()], columns=['item', 'category', 'price']),
+        gutter_tables=MappingProxyType({c: pd.DataFrame({'Item': ks, 'Price Per Ft': [f"${items[k]['price']:.2f}" for k in ks]}) for c, ks in by_category.items()}),
+        frames=MappingProxyType({name: pd.DataFrame(tables[key], columns=cols) for name, (key, cols) in DISPLAY_TABLES.items()}),
+        editable=MappingProxyType({svc: MappingProxyType({name: pd.DataFrame(tables[key], columns=cols) for name, (key, cols) in editors.items()})
+                                   for svc, editors in EDITABLE_TABLES.items()}),
+        loxon_tiers=_frozen([_tier_floor(r[1]) for r in tables['loxon_above']]),
+        loxon_rates=MappingProxyType({'above': _frozen([r[3] for r in tables['loxon_above']]), 'below': _frozen([r[3] for r in tables['loxon_below']])}),
+        loxon_trim_rates=tuple(r[3] for r in tables['loxon_trim']),
+        painting_wall_rates=tuple(r[2] for r in tables['painting_walls']),
+        painting_trim_rates=tuple(r[3] for r in tables['painting_trim']),
+        stone_item_rates=tuple(r[3] for r in tables['stone_items']),
+        stone_debris_rates=_frozen([r[2] for r in tables['stone_debris']]),
+        stone_rules=compile_stone_rules(card['stone_rules']),
+        stucco_minimums=_frozen([_amount(r[1]) for r in tables['stucco_minimums']]),
+        gutter_minimums=MappingProxyType(dict(gutter_minimums)),
+        gutter_terms=GUTTER_TERMS.format(**gutter_minimums),
+    )
+
+
+class RateCard:
+    """The catalog for a rate-card file, rebuilt when the file changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self.stamp = self.digest = self.catalog = None
+        self.lock = threading.Lock()
+
+    def _stamp(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def current(self):
+        stamp = self._stamp()
+        if self.catalog is not None and stamp == self.stamp:
+            return self.catalog
+        with self.lock:
+            if self.catalog is None or stamp != self.stamp:
+                self.stamp = stamp
+                self._reload()
+            return self.catalog
+
+    def _reload(self):
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            if self.catalog is None:
+                log.warning("rate card %s unreadable (%s); using the built-in card", self.path, e)
+                self.catalog = build_catalog()
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self.digest:
+            return
+        try:
+            card = json.loads(data)
+            validate_card(card)
+            catalog = build_catalog(card, f"{card['version']}@{digest[:8]}")
+        except (ValueError, KeyError, TypeError) as e:
+            log.error("rate card %s rejected: %s", self.path, e)
+            if self.catalog is None:
+                self.catalog = build_catalog()
+            return
+        self.digest = digest
+        self.catalog = catalog
+        log.info("rate card %s loaded", catalog.version)
+
+
+_live = RateCard(RATECARD)
+
+
+def get_catalog():
+    """The catalog for the rate card as it is on disk now."""
+    return _live.current()
@@ -0,0 +1,93 @@
+"""Feet-and-inches dimensions for the Width and Height grid columns.
+
+Reps type dimensions the way a tape or a measuring app gives them:
+
+    12      12.5     12'      12 ft
+    12'6"   12' 6"   12'-6"   12'6    12 6
+    6"      6 1/2"   12' 6 1/2"   12 1/2
+
+A bare number is feet. Inches need a unit unless feet come first, and after
+feet they must be under 12. Exponents ("1e3") are not dimensions. Whole
+columns are parsed with one vectorized regex extract, and the pieces are
+combined with array arithmetic. Cells that do not parse come back as NaN and
+are reported together, so a pasted column is checked in one pass instead of
+failing row by row. Blank cells are simply missing, not invalid.
+"""
+import numpy as np
+import pandas as pd
+
+_NUM = r'\d+(?:\.\d+)?|\.\d+'
+
+PATTERN = rf"""(?ix)^\s*
+    (?:(?P<ft>{_NUM})(?:\s*(?P<ftu>'|’|′|ft\.?|feet|foot))?)?
+    (?P<sep>\s*-\s*|\s+)?
+    (?:(?P<inch>{_NUM})?\s*(?:(?P<num>\d+)/(?P<den>\d+))?(?:\s*(?P<inu>"|”|″|''|in\.?|inch(?:es)?))?)?
+    \s*$"""
+
+DIM_COLS = ('Width', 'Height')
+
+
+def _extract(s):
+    # Feet for the cells the plain-number pass could not read, NaN if bad.
+    m = s.str.extract(PATTERN)
+    ft, inch, num, den = (pd.to_numeric(m[k]).to_numpy(float) for k in ('ft', 'inch', 'num', 'den'))
+    has_ftu, has_inu = m['ftu'].notna().to_numpy(), m['inu'].notna().to_numpy()
+    sep = m['sep'].fillna('')
+    # "6"" and "6 1/2"": a number with no feet unit, followed only by an
+    # inch unit, is inches.
+    moved = np.isnan(inch) & ~has_ftu & has_inu & ~np.isnan(ft)
+    inch = np.where(moved, ft, inch)
+    ft = np.where(moved, np.nan, ft)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frac = np.where(np.isnan(num), 0, num / den)
+    ok = (~np.isnan(ft) | ~np.isnan(inch) | ~np.isnan(num)) & np.isfinite(frac)
+    # Without a feet unit, feet and inches need a space between them ("12 6",
+    # not "5.5.5"), and a dash needs a feet unit before it ("12'-6", not "-3").
+    loose = ~has_ftu & ~np.isnan(ft) & (~np.isnan(inch) | ~np.isnan(num))
+    ok &= ~(loose & ~sep.str.fullmatch(r'\s+').to_numpy())
+    ok &= ~(sep.str.contains('-').to_numpy() & ~has_ftu)
+    # "12 1/2" with no units at all is a fraction of a foot.
+    feet_frac = ~has_ftu & ~has_inu & np.isnan(inch)
+    # Inches after feet are the part of a foot left over: 12' 13" is a typo.
+    ok &= ~(~np.isnan(ft) & ~feet_frac & (np.nan_to_num(inch) + frac >= 12))
+    feet = np.nan_to_num(ft) + np.where(feet_frac, frac, (np.nan_to_num(inch) + frac) / 12)
+    return np.where(ok, feet, np.nan)
+
+
+def parse(values):
+    """``(feet, bad)`` arrays for a column of dimension strings.
+
+    ``feet`` is float64, NaN where the cell is blank or bad, and rounded to
+    the 1/10,000 ft that quantities are priced at. ``bad`` marks non-blank
+    cells that are not a dimension. Plain decimals, the usual case, skip the
+    feet-and-inches pattern.
+    """
+    s = pd.Series(values, dtype='str')
+    blank = (s.str.strip().fillna('') == '').to_numpy()
+    feet = pd.to_numeric(s, errors='coerce').to_numpy(float, copy=True)
+    # to_numeric also reads "1e3", "inf" and "-3"; only plain decimals are feet.
+    feet[~s.str.fullmatch(rf'\s*(?:{_NUM})\s*').to_numpy(bool, na_value=False)] = np.nan
+    rest = np.isnan(feet) & ~blank
+    if rest.any():
+        feet[rest] = _extract(s[rest])
+    return feet.round(4), np.isnan(feet) & ~blank
+
+
+def measure(df, total_col):
+    """Fill ``total_col`` with Width x Height and list the cells that did not parse.
+
+    Rows without both dimensions keep whatever total was typed. Returns the
+    frame (``df`` itself if nothing changed) and a ``(row, column, text)``
+    frame of bad cells.
+    """
+    dims, bad = {}, []
+    for c in DIM_COLS:
+        dims[c], b = parse(df[c])
+        bad += [(i, c, v) for i, v in zip(np.flatnonzero(b), df[c].to_numpy()[b])]
+    sf = dims['Width'] * dims['Height']
+    total = df[total_col]
+    typed = pd.to_numeric(total, errors='coerce').to_numpy('float64', na_value=np.nan)
+    filled = pd.Series(np.where(np.isnan(sf), typed, sf.round(2)), index=df.index).astype(total.dtype)
+    if not filled.equals(total):
+        df = df.assign(**{total_col: filled})
+    return df, pd.DataFrame(bad, columns=['row', 'column', 'text'])
@@ -0,0 +1,81 @@
+"""One estimate for the whole job, across every service.
+
+Each service's engine prices its own lines. ``combine`` stacks them into one
+normalized line table:
+
+    service  item  category  qty  price  total
+
+It adds the gutter job minimum, then prices the job with a single
+``calc_pricing`` ladder. Gutters carry the combined minimum when any other
+service is on the job and the stand-alone minimum otherwise. The stone zone
+minimum and the stucco LOXON minimum are already lines from their engines.
+A combined job pays repair and rigging at most once each.
+
+Service subtotals and the job total come from one group-by over the table, in
+whole cents. ``sections`` turns the table into the estimate sections shared by
+the app summary, the PDF and the estimate store: one per service, then the
+job total with the ladder.
+"""
+import numpy as np
+import pandas as pd
+
+import money
+from catalog import SERVICE_DATA, get_catalog
+from pricing import LINE_COLS, calc_pricing, gutter_minimum, line_rows
+
+TITLES = {'gutters': SERVICE_DATA['gutters']['name'], 'stone': 'Stone Veneer', 'stucco': 'Stucco Painting', 'painting': 'House Painting'}
+SERVICE = pd.CategoricalDtype(list(TITLES))
+COLUMNS = ['service'] + LINE_COLS
+
+
+def gutter_lines(tots, catalog=None):
+    """The gutter engine's ``{item: {'qty', 'price', 'total'}}`` as priced lines."""
+    catalog = catalog or get_catalog()
+    return pd.DataFrame([[k, catalog.items[k]['category'], t['qty'], t['price'], t['total']] for k, t in tots.items()], columns=LINE_COLS)
+
+
+def combine(parts, rep=False, rig=False, catalog=None):
+    """Price a job from each service's priced lines.
+
+    ``parts`` maps a service to its engine's line frame. Returns ``(lines,
+    subtotals, prc)``: the normalized line table, the subtotal per service
+    in dollars, and the ladder for the job total.
+    """
+    catalog = catalog or get_catalog()
+    parts = {s: df for s, df in parts.items() if len(df)}
+    lines = pd.concat([df[LINE_COLS].assign(service=s) for s, df in parts.items()] or [pd.DataFrame(columns=LINE_COLS + ['service'])],
+                      ignore_index=True)
+    if 'gutters' in parts:
+        combined = len(parts) > 1
+        short = int(gutter_minimum(int(money.cents(parts['gutters']['total']).sum()), combined, catalog))
+        if short:
+            label = f"Job minimum - gutters ({'combined' if combined else 'stand-alone'})"
+            lines.loc[len(lines)] = {'service': 'gutters', 'item': label, 'category': 'minimum', 'qty': 1, 'price': money.dollars(short),
+                                     'total': money.dollars(short)}
+    lines['service'] = lines['service'].astype(SERVICE)
+    lines = lines.sort_values('service', kind='stable', ignore_index=True)[COLUMNS]
+    cents = pd.Series(money.cents(lines['total'].to_numpy(float)), index=lines.index).groupby(lines['service'], observed=True).sum()
+    subtotals = money.dollars(cents)
+    return lines, subtotals, calc_pricing(money.dollars(int(cents.sum())), rep, rig)
+
+
+def _values(lines):
+    return np.column_stack([money.qty(lines['qty'].to_numpy(float)) / money.QTY,
+                            money.dollars(money.cents(lines['price'].to_numpy(float))),
+                            money.dollars(money.cents(lines['total'].to_numpy(float)))]).tolist()
+
+
+def sections(lines, subtotals, prc):
+    """Estimate sections for the PDF and the store: each service's lines, then the job total.
+
+    ``kind`` is ``'items'`` for a service's priced lines and ``'total'`` for
+    the job total, which lists service subtotals instead. ``lines`` are the
+    display strings. An item section also carries ``values``, each line's
+    qty, price and total as numbers for export, money in whole cents.
+    """
+    secs = [{'title': TITLES[s], 'kind': 'items', 'columns': ['Item', 'Qty', 'Price', 'Total'], 'lines': line_rows(g), 'values': _values(g)}
+            for s, g in lines.groupby('service', observed=True, sort=True)]
+    if secs:
+        secs.append({'title': 'Job Total', 'kind': 'total', 'columns': ['Service', 'Subtotal'],
+                     'lines': [[TITLES[s], f"${v:.2f}"] for s, v in subtotals.items()], 'prc': prc})
+    return secs
@@ -0,0 +1,225 @@
+"""Export saved estimates in bulk for analysis.
+
+    python export.py quotes.parquet --since 2025-01-01 --until 2026-01-01
+    python export.py quotes.csv
+    python export.py quotes.xlsx        # needs openpyxl (optional, not installed by requirements.txt)
+
+Three tables come out, keyed by ``estimate_id``:
+
+* ``estimates``     one row per section, with the customer, rep and
+                    rate-card version; the section carrying the
+                    ``calc_pricing`` ladder (the job total) has it filled in
+* ``lines``         the section's priced lines: item, qty, price, total
+* ``measurements``  every filled grid row, with Width and Height also
+                    parsed to feet
+
+Parquet and CSV write one file per table beside the output path
+(``quotes.lines.parquet``). XLSX writes one sheet per table, continued on
+``lines 2`` and so on past Excel's row limit. It goes through openpyxl a
+cell at a time, so it is far slower than the other two for a year of
+quotes.
+
+Estimates are read from the store a page at a time. Each page becomes one
+Arrow record batch per table and is appended to the open writers: a Parquet
+row group, a block of CSV rows or rows of a write-only sheet. Memory stays at
+one page however many quotes are exported. Money columns are dollars and
+always hold a whole number of cents.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import dims
+import store
+from grids import GRIDS
+from pricing import GUTTER_COLS, num
+
+PAGE = 500
+TABLES = ('estimates', 'lines', 'measurements')
+LADDER = ['y1', 'd1', 'd30', 'd2', 'dof', 'd3', 'rep', 'rig', 'fin']
+VALUE_FIELDS = ('qty', 'price', 'total')
+
+_ID = [('estimate_id', pa.int64()), ('section', pa.string())]
+SCHEMAS = {
+    'estimates': pa.schema([('estimate_id', pa.int64()), ('created', pa.timestamp('s')), ('customer_name', pa.string()),
+                            ('project_address', pa.string()), ('sales_rep', pa.string()), ('ratecard', pa.string()),
+                            ('section', pa.string())] + [(k, pa.float64()) for k in LADDER]),
+    'lines': pa.schema(_ID + [('item', pa.string()), ('qty', pa.float64()), ('price', pa.float64()), ('total', pa.float64())]),
+    'measurements': pa.schema([('estimate_id', pa.int64()), ('service', pa.string()), ('table', pa.string()), ('row', pa.int32()),
+                               ('location', pa.string()), ('item', pa.string()), ('width', pa.string()), ('height', pa.string()),
+                               ('width_ft', pa.float64()), ('height_ft', pa.float64()), ('qty', pa.float64())]),
+}
+
+SERVICES = {key: service for service, (key, _) in GRIDS.items()}
+ITEM_COLS = set(GUTTER_COLS.values())
+# The one quantity column of each measurement table.
+QTY_COLS = ('LF', 'Quantity', 'Openings', 'Total SF', 'Total')
+
+
+def _values(sec):
+    if 'values' in sec:
+        return sec['values']
+    # Sections saved before ``values`` existed carry only the PDF strings
+    # ("12.50", "$1,234.00"), so read the numbers back from those.
+    return [[float(str(v).replace('$', '').replace(',', '')) for v in row[1:]] for row in sec['lines']]
+
+
+def _measurements(estimate_id, state, cols):
+    # Grids are gathered column by column; empty rows are dropped per page.
+    for key, tables in state.get('tables', {}).items():
+        if key not in SERVICES:
+            continue
+        for table, frame in tables.items():
+            n = len(frame['data'])
+            if not n:
+                continue
+            at = dict(zip(frame['columns'], zip(*frame['data'])))
+            blank = (None,) * n
+            for c, v in [('estimate_id', (estimate_id,) * n), ('service', (SERVICES[key],) * n), ('table', (table,) * n), ('row', range(n)),
+                         ('location', at.get('Location', blank)), ('item', next((at[c] for c in ITEM_COLS if c in at), blank)),
+                         ('width', at.get('Width', blank)), ('height', at.get('Height', blank)),
+                         ('qty', next((at[c] for c in QTY_COLS if c in at), blank))]:
+                cols[c].extend(v)
+
+
+def batches(rows):
+    """``{table: RecordBatch}`` for one page of ``store.scan`` rows."""
+    cols = {t: {f.name: [] for f in s} for t, s in SCHEMAS.items()}
+    est, lines, meas = cols['estimates'], cols['lines'], cols['measurements']
+    for i, created, name, addr, rep, _, ratecard, state, sections in rows:
+        for sec in json.loads(sections):
+            for c, v in zip(('estimate_id', 'created', 'customer_name', 'project_address', 'sales_rep', 'ratecard', 'section'),
+                            (i, created, name, addr, rep, ratecard, sec['title'])):
+                est[c].append(v)
+            prc = sec.get('prc') or {}
+            for k in LADDER:
+                est[k].append(prc.get(k))
+            # The job total lists service subtotals, not item lines. Sections
+            # saved before it existed were all item sections.
+            if sec.get('kind', 'items') != 'items':
+                continue
+            n = len(sec['lines'])
+            lines['estimate_id'].extend((i,) * n)
+            lines['section'].extend((sec['title'],) * n)
+            lines['item'].extend(row[0] for row in sec['lines'])
+            for c, v in zip(VALUE_FIELDS, zip(*_values(sec))):
+                lines[c].extend(v)
+        _measurements(i, json.loads(state), meas)
+    est['created'] = pc.cast(pa.array(est['created'], pa.string()), pa.timestamp('s'))
+    # Cells saved before the grids were typed are text; read them as the
+    # engines do. Width and Height go through the vectorized dims parser.
+    qty = num(pd.Series(meas['qty'], dtype=object)).round(4)
+    meas['qty'] = pa.array(qty, pa.float64(), from_pandas=True)
+    filled = qty.notna().to_numpy() | pd.notna(pd.Series(meas['item'], dtype=object)).to_numpy()
+    for c in dims.DIM_COLS:
+        text = pd.Series(meas[c.lower()], dtype=object).astype('str')
+        filled |= (text.str.strip().fillna('') != '').to_numpy()
+        meas[c.lower()] = pa.array(text, pa.string(), from_pandas=True)
+        meas[f'{c.lower()}_ft'] = pa.array(dims.parse(text)[0], pa.float64(), from_pandas=True)
+    out = {t: pa.RecordBatch.from_pydict(cols[t], schema=SCHEMAS[t]) for t in TABLES}
+    out['measurements'] = out['measurements'].filter(pa.array(filled))
+    return out
+
+
+class _Parquet:
+    def __init__(self, path):
+        import pyarrow.parquet as pq
+        self.writers = {t: pq.ParquetWriter(_beside(path, t), SCHEMAS[t]) for t in TABLES}
+
+    def write(self, table, batch):
+        self.writers[table].write_batch(batch)
+
+    def close(self):
+        for w in self.writers.values():
+            w.close()
+
+
+class _CSV(_Parquet):
+    def __init__(self, path):
+        import pyarrow.csv as csv
+        self.writers = {t: csv.CSVWriter(_beside(path, t), SCHEMAS[t]) for t in TABLES}
+
+
+class _XLSX:
+    # Excel's row limit, header included. A table that outgrows it carries on
+    # in "lines 2", "lines 3" and so on.
+    ROWS = 1_048_576
+
+    def __init__(self, path):
+        try:
+            from openpyxl import Workbook
+        except ImportError as e:
+            raise RuntimeError('XLSX export needs openpyxl: pip install openpyxl') from e
+        # Write-only sheets stream rows to disk as they are appended.
+        self.path, self.wb = path, Workbook(write_only=True)
+        self.sheets, self.rows, self.parts = {}, {}, dict.fromkeys(TABLES, 0)
+        for t in TABLES:
+            self._sheet(t)
+
+    def _sheet(self, table):
+        self.parts[table] += 1
+        ws = self.sheets[table] = self.wb.create_sheet(table if self.parts[table] == 1 else f'{table} {self.parts[table]}')
+        ws.append(SCHEMAS[table].names)
+        self.rows[table] = 1
+
+    def write(self, table, batch):
+        for row in zip(*(c.to_pylist() for c in batch.columns)):
+            if self.rows[table] == self.ROWS:
+                self._sheet(table)
+            self.sheets[table].append(row)
+            self.rows[table] += 1
+
+    def close(self):
+        self.wb.save(self.path)
+
+
+WRITERS = {'.parquet': _Parquet, '.csv': _CSV, '.xlsx': _XLSX}
+
+
+def _beside(path, table):
+    path = Path(path)
+    return str(path.with_name(f'{path.stem}.{table}{path.suffix}'))
+
+
+def export(path, since=None, until=None, page=PAGE):
+    """Write every saved estimate created in ``[since, until)`` to ``path``. Returns the estimate count."""
+    out = WRITERS[Path(path).suffix.lower()](path)
+    n = 0
+    try:
+        for rows in store.scan(since, until, page):
+            for t, batch in batches(rows).items():
+                out.write(t, batch)
+            n += len(rows)
+    finally:
+        out.close()
+    return n
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Export saved estimates for analysis.')
+    p.add_argument('output', help=f"output file ({', '.join(WRITERS)}); Parquet and CSV write one file per table")
+    p.add_argument('--since', help='earliest created date, inclusive (YYYY-MM-DD)')
+    p.add_argument('--until', help='latest created date, exclusive (YYYY-MM-DD)')
+    p.add_argument('--page', type=int, default=PAGE, help='estimates read and written per batch')
+    args = p.parse_args(argv)
+    if Path(args.output).suffix.lower() not in WRITERS:
+        p.error(f"output must end in one of {', '.join(WRITERS)}")
+
+    t = time.perf_counter()
+    try:
+        n = export(args.output, args.since, args.until, args.page)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    dt = time.perf_counter() - t
+    print(f"exported {n} estimates in {dt:.2f}s ({n / dt if dt else 0:.1f} estimates/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Per-session memo of table subtotals, service totals and pricing ladders.
+
+Reruns only recompute what an edit touched. The work is a three-level graph:
+
+    table    (service, table, content hash)          -> engine table_subtotal
+    service  (service, every table hash, params)     -> engine combine
+    pricing  (service total, repair, rigging)        -> calc_pricing
+
+A single edited cell changes one table hash. That misses the service node
+for that tab and the one table node under it, and every other table and tab
+hits. Table and service keys also carry the rate-card version, so a new card
+misses everything priced under the old one. Entries live in one LRU per
+session, bounded by count. Cached results are shared between reruns, so
+treat them as read-only.
+"""
+import hashlib
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import painting
+import stone
+import stucco
+from pricing import calc_pricing, combine_gutters, gutter_table
+
+MAXSIZE = 256
+
+ENGINES = {
+    'gutters': (gutter_table, combine_gutters),
+    'stone': (stone.table_subtotal, stone.combine),
+    'stucco': (stucco.table_subtotal, stucco.combine),
+    'painting': (painting.table_subtotal, painting.combine),
+}
+
+
+def content_hash(df):
+    """Digest of a frame's columns, dtypes and values, independent of identity."""
+    h = hashlib.blake2b(repr((tuple(df.columns), tuple(map(str, df.dtypes)), len(df))).encode(), digest_size=16)
+    for _, s in df.items():
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            h.update(s.array.codes.tobytes())
+        elif pd.api.types.is_numeric_dtype(s.dtype):
+            h.update(s.to_numpy('float64', na_value=np.nan).tobytes())
+        else:
+            # The null mask keeps a missing cell apart from the text 'nan',
+            # 'None' or ''; str() still tells None from NaN.
+            h.update(s.isna().to_numpy().tobytes())
+            h.update('\x1f'.join(map(str, s.tolist())).encode())
+    return h.digest()
+
+
+class Memo:
+    def __init__(self, maxsize=MAXSIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def get(self, kind, key, fn):
+        k = (kind, key)
+        if k in self.entries:
+            self.entries.move_to_end(k)
+            self.hits[kind] += 1
+            return self.entries[k]
+        self.misses[kind] += 1
+        value = self.entries[k] = fn()
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def totals(self, service, tables, catalog, **params):
+        """``service``'s engine result for ``tables``, recomputing only changed tables."""
+        subtotal, combine = ENGINES[service]
+        hashes = {name: content_hash(df) for name, df in tables.items()}
+        key = (service, catalog.version, tuple(hashes.items()), tuple(sorted(params.items())))
+
+        def compute():
+            subs = {name: self.get('table', (service, catalog.version, name, h), lambda: subtotal(name, tables[name], catalog))
+                    for name, h in hashes.items()}
+            return combine(subs, catalog, **params)
+
+        return self.get('service', key, compute)
+
+    def pricing(self, sub, rep=False, rig=False):
+        return self.get('pricing', (sub, bool(rep), bool(rig)), lambda: calc_pricing(sub, rep, rig))
+
+    def stats(self):
+        return {'entries': len(self.entries), 'maxsize': self.maxsize, 'hits': dict(self.hits), 'misses': dict(self.misses)}
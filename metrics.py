@@ -0,0 +1,147 @@
+"""Opt-in per-section rerun timing.
+
+Off unless PRICING_METRICS is set when the process starts (empty, 0 and
+false leave it off):
+
+    PRICING_METRICS=1               in-app debug panel only
+    PRICING_METRICS=metrics.jsonl   panel + one JSON line per section, rotated at 5 MB
+    PRICING_METRICS=metrics.prom    panel + Prometheus text file, rewritten after each full
+                                    rerun and at most once a second for fragment reruns
+
+When off, ``laps()`` hands back a shared no-op timer, so an instrumented
+section costs one method call and nothing is recorded.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+TARGET = os.environ.get('PRICING_METRICS', '').strip()
+ENABLED = TARGET.lower() not in ('', '0', 'false')
+
+MAX_BYTES = 5 * 1024 * 1024
+BACKUPS = 3
+RECENT = 50
+SESSIONS = 64
+PROM_INTERVAL = 1.0
+
+_lock = threading.Lock()
+_recent = OrderedDict()
+
+
+class _JsonlSink:
+    def __init__(self, path):
+        self.log = logging.getLogger('pricing.metrics')
+        self.log.propagate = False
+        self.log.setLevel(logging.INFO)
+        if not self.log.handlers:
+            self.log.addHandler(RotatingFileHandler(path, maxBytes=MAX_BYTES, backupCount=BACKUPS))
+
+    def write(self, rec):
+        self.log.info(json.dumps(rec))
+
+
+class _PromSink:
+    # Sessions are left out of the labels to keep the series count bounded;
+    # they are in the panel and the JSONL output.
+    def __init__(self, path):
+        self.path = path
+        self.seconds = defaultdict(float)
+        self.count = defaultdict(int)
+        self.rows = {}
+        self.written = 0.0
+
+    def write(self, rec):
+        s = rec['section']
+        self.seconds[s] += rec['wall_ms'] / 1000
+        self.count[s] += 1
+        if rec['rows'] is not None:
+            self.rows[s] = rec['rows']
+        now = time.monotonic()
+        if now - self.written >= PROM_INTERVAL:
+            self.written = now
+            self.flush()
+
+    def flush(self):
+        out = ['# HELP pricing_section_seconds Wall time spent in each app section.', '# TYPE pricing_section_seconds summary']
+        for s in sorted(self.count):
+            out.append(f'pricing_section_seconds_sum{{section="{s}"}} {self.seconds[s]:.6f}')
+            out.append(f'pricing_section_seconds_count{{section="{s}"}} {self.count[s]}')
+        out += ['# HELP pricing_section_rows Rows handled by the section on its last run.', '# TYPE pricing_section_rows gauge']
+        out += [f'pricing_section_rows{{section="{s}"}} {n}' for s, n in sorted(self.rows.items())]
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            f.write('\n'.join(out) + '\n')
+        os.replace(tmp, self.path)
+
+
+if TARGET.endswith('.prom'):
+    _sink = _PromSink(TARGET)
+    atexit.register(_sink.flush)
+elif ENABLED and TARGET.lower() not in ('1', 'true', 'panel'):
+    _sink = _JsonlSink(TARGET)
+else:
+    _sink = None
+
+
+def record(session, section, wall_ms, rows=None):
+    rec = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'session': session, 'section': section,
+           'wall_ms': round(wall_ms, 3), 'rows': rows}
+    with _lock:
+        if session not in _recent:
+            _recent[session] = deque(maxlen=RECENT)
+            if len(_recent) > SESSIONS:
+                _recent.popitem(last=False)
+        _recent.move_to_end(session)
+        _recent[session].append(rec)
+        if _sink:
+            _sink.write(rec)
+
+
+def flush():
+    """Write the Prometheus file now instead of waiting out the interval."""
+    with _lock:
+        if isinstance(_sink, _PromSink):
+            _sink.flush()
+
+
+def recent(session):
+    """Most recent records for a session, newest last."""
+    with _lock:
+        return list(_recent.get(session, ()))
+
+
+class Laps:
+    """Times consecutive sections of a script run.
+
+    Each ``lap(name)`` records the time since the previous lap (or since the
+    timer was made) as ``<prefix>.<name>``. ``rows`` may be a number or a
+    callable, which is only called while timing is on.
+    """
+
+    def __init__(self, prefix, session):
+        self.prefix = prefix
+        self.session = session
+        self.t = time.perf_counter()
+
+    def lap(self, name, rows=None):
+        now = time.perf_counter()
+        record(self.session, f'{self.prefix}.{name}', (now - self.t) * 1000, rows() if callable(rows) else rows)
+        self.t = time.perf_counter()
+
+
+class _NoLaps:
+    def lap(self, name, rows=None):
+        pass
+
+
+NO_LAPS = _NoLaps()
+
+
+def laps(prefix, session=''):
+    return Laps(prefix, session) if ENABLED else NO_LAPS
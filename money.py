@@ -0,0 +1,86 @@
+"""Fixed-point money: int64 cents and 1/10,000 quantities.
+
+Prices are held as whole cents and quantities as ten-thousandths of a unit.
+Both are quantized here, on the way in, so a total never depends on how a
+value was stored before it arrived. A line total is then an exact integer
+product, rounded once to the cent:
+
+    total = round(qty_e4 * price_cents / 10_000)
+
+The discount ladder rounds each discount to the cent and subtracts it, so
+every price on the ladder is exact and the printed ladder adds up line by
+line:
+
+    d1  = round(y1  * 10%)     d30 = y1  - d1
+    d2  = round(d30 * 10%)     dof = d30 - d2
+    d3  = round(dof * 3%)      fin = dof - d3 + repair + rigging
+
+Every ``round`` here is to the nearest unit, with halves away from zero,
+done in integer arithmetic. Dollars come in and go out as floats at the
+edges, and each is a whole number of cents. Everything works on Python ints
+and on int64 arrays alike, so batches are priced in single vectorized
+integer passes.
+"""
+import math
+
+import numpy as np
+
+CENT = 100
+QTY = 10_000
+
+REPAIR = 2100 * CENT
+RIGGING = 1400 * CENT
+
+# Ladder discounts in percent.
+EARLY = 10
+DAY_OF = 10
+DEPOSIT = 3
+
+
+def _fixed(x, scale):
+    # Dollars or quantities to integers, nearest unit, halves away from zero.
+    if isinstance(x, (int, np.integer)):
+        return int(x) * scale
+    if isinstance(x, float):
+        return math.trunc(x * scale + math.copysign(0.5, x))
+    a = np.asarray(x, dtype=float)
+    return np.trunc(a * scale + np.copysign(0.5, a)).astype(np.int64)
+
+
+def cents(dollars):
+    return _fixed(dollars, CENT)
+
+
+def qty(q):
+    return _fixed(q, QTY)
+
+
+def dollars(c):
+    return c / CENT
+
+
+def div_round(n, d):
+    """``n / d`` to the nearest integer, halves away from zero. ``d`` > 0."""
+    q = (abs(n) * 2 + d) // (2 * d)
+    return np.where(n < 0, -q, q) if isinstance(q, np.ndarray) else (-q if n < 0 else q)
+
+
+def extend(q, price):
+    """Line totals in cents for quantities ``q`` at ``price`` dollars each."""
+    return div_round(qty(q) * cents(price), QTY)
+
+
+def percent(c, pct):
+    return div_round(c * pct, 100)
+
+
+def ladder(y1, rep=False, rig=False):
+    """The discount ladder in cents for a subtotal of ``y1`` cents."""
+    d1 = percent(y1, EARLY)
+    d30 = y1 - d1
+    d2 = percent(d30, DAY_OF)
+    dof = d30 - d2
+    d3 = percent(dof, DEPOSIT)
+    rep = rep * REPAIR
+    rig = rig * RIGGING
+    return {'y1': y1, 'd1': d1, 'd30': d30, 'd2': d2, 'dof': dof, 'd3': d3, 'rep': rep, 'rig': rig, 'fin': dof - d3 + rep + rig}
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from catalog import get_catalog
+from pricing import editor_lines, lines_total, num, price_lines, wall_sf
+
+# Measured tables feeding each painting_trim row. The two shutter rows have
+# no measurement grid and take their pair counts from the tab directly.
+TRIM_SOURCES = {0: ('window_trim', 'Openings'), 1: ('door_trim', 'Openings'), 2: ('fascia', 'LF'), 3: ('soffit', 'LF'),
+                6: ('entry_doors', 'Openings'), 7: ('garage_doors', 'Openings')}
+SHUTTER_ROWS = (4, 5)
+TRIM_COLS = dict(TRIM_SOURCES.values())
+
+OUTS_KEYS = ['painting_front_outs', 'painting_front_right_outs', 'painting_rear_outs', 'painting_front_left_outs']
+
+
+def table_subtotal(name, df, catalog=None):
+    """Reduce one painting table to what the job total needs from it."""
+    if name == 'walls':
+        return float(wall_sf(df).sum())
+    if name in TRIM_COLS:
+        return float(num(df[TRIM_COLS[name]]).sum())
+    if name == 'misc':
+        return price_lines([editor_lines(df, 'Quantity', 'Price Per Unit', 'misc')])
+    return None
+
+
+def combine(subs, catalog=None, outs=0, substrate=0, shutters=(0, 0)):
+    """Price a house painting job from its table subtotals.
+
+    Wall SF less 100% of the outs is rounded up to full squares and billed
+    at the chosen substrate rate. ``substrate`` indexes the painting_walls
+    rows and ``shutters`` gives the pairs for the two shutter rows. Returns
+    ``(lines, info, subtotal)``.
+    """
+    catalog = catalog or get_catalog()
+    gross = subs['walls']
+    net = max(gross - outs, 0)
+    squares = math.ceil(net / 100)
+
+    trim_qty = np.zeros(len(catalog.painting_trim_rates))
+    for i, (name, _) in TRIM_SOURCES.items():
+        trim_qty[i] = subs[name]
+    trim_qty[list(SHUTTER_ROWS)] = num(pd.Series(shutters, dtype=object)).fillna(0).to_numpy()
+
+    lines = price_lines([
+        pd.DataFrame({'item': [catalog.tables['painting_walls'][substrate][0]], 'category': 'walls', 'qty': [squares * 100], 'price': [catalog.painting_wall_rates[substrate]]}),
+        pd.DataFrame({'item': [r[0] for r in catalog.tables['painting_trim']], 'category': 'trim', 'qty': trim_qty, 'price': catalog.painting_trim_rates}),
+        subs['misc'],
+    ])
+    info = {'gross_sf': gross, 'outs': outs, 'net_sf': net, 'squares': squares, 'billed_sf': squares * 100, 'substrate': substrate}
+    return lines, info, lines_total(lines)
+
+
+def painting_totals(meas, pricing, outs=0, substrate=0, shutters=(0, 0), catalog=None):
+    """Price a house painting job. See :func:`combine`."""
+    subs = {name: table_subtotal(name, df, catalog) for name, df in {**meas, **pricing}.items()}
+    return combine(subs, catalog, outs, substrate, shutters)
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from catalog import GUTTER_MINIMUMS, GUTTER_TERMS, STONE_GUIDELINES, STONE_MINIMUMS, STUCCO_MINIMUMS
+from pricing import ladder_rows
+
+COMPANY = "Garden State Brickface & Siding"
+
+GRID_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8EAF0')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#B0B4BE')),
+    ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+LADDER_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#FFF3B0')),
+])
+
+# Rendering runs off the Streamlit script thread. Two workers keep one slow
+# estimate from queueing behind another without letting PDF work crowd out
+# the reruns sharing this process.
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pdf')
+
+
+@lru_cache(maxsize=None)
+def _styles():
+    ss = getSampleStyleSheet()
+    return {
+        'title': ss['Title'],
+        'h2': ss['Heading2'],
+        'h3': ss['Heading3'],
+        'body': ss['BodyText'],
+        'small': ParagraphStyle('small', parent=ss['BodyText'], fontSize=8, leading=10, textColor=colors.HexColor('#444444')),
+    }
+
+
+@lru_cache(maxsize=None)
+def _boilerplate():
+    # Flowables are laid out in place by reportlab, so only their source
+    # text is shared; each document gets fresh Paragraph/Table objects.
+    return (
+        tuple(f"&bull; {escape(g)}" for g in STONE_GUIDELINES),
+        tuple(map(tuple, STONE_MINIMUMS)),
+        tuple(map(tuple, STUCCO_MINIMUMS)),
+        GUTTER_TERMS.format(**GUTTER_MINIMUMS),
+    )
+
+
+def _table(rows, style, widths=None):
+    t = Table([list(r) for r in rows], colWidths=widths, repeatRows=1 if style is GRID_STYLE else 0, hAlign='LEFT')
+    t.setStyle(style)
+    return t
+
+
+def render_estimate(est):
+    """Render an estimate to PDF.
+
+    ``est`` is plain data so it can cross into the worker pool: a
+    ``customer`` dict (customer_name, project_address, sales_rep), an
+    optional ``date`` and a list of ``sections``, each with a ``title``,
+    ``columns``, ``lines`` and an optional ``calc_pricing`` result ``prc``.
+    An optional ``ratecard`` version is printed in the header, and optional
+    ``minimums`` (``stone``/``stucco`` rows) and ``terms`` replace the
+    built-in tables and gutter terms.
+    """
+    s = _styles()
+    guidelines, stone_min, stucco_min, terms = _boilerplate()
+    terms = escape(est.get('terms', terms))
+    stone_min = [['Description', 'Amount'], *est.get('minimums', {}).get('stone', stone_min)]
+    stucco_min = [['Service', 'Amount'], *est.get('minimums', {}).get('stucco', stucco_min)]
+    c = est['customer']
+    buf = BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter, leftMargin=0.6 * inch, rightMargin=0.6 * inch, topMargin=0.6 * inch, bottomMargin=0.6 * inch,
+                            title=f"Estimate - {c['customer_name']}", author=COMPANY)
+    story = [
+        Paragraph(f"{COMPANY} Estimate", s['title']),
+        _table([['Customer', c['customer_name']], ['Project Address', c['project_address']], ['Sales Representative', c['sales_rep']],
+                ['Date', est.get('date') or datetime.now().strftime('%m/%d/%Y')]] + ([['Rate Card', est['ratecard']]] if est.get('ratecard') else []), TableStyle([('FONTSIZE', (0, 0), (-1, -1), 10), ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')]),
+               [1.8 * inch, 5 * inch]),
+        Spacer(1, 0.25 * inch),
+    ]
+    for sec in est['sections']:
+        story.append(Paragraph(escape(sec['title']), s['h2']))
+        if sec['lines']:
+            story.append(_table([sec['columns']] + sec['lines'], GRID_STYLE))
+        else:
+            story.append(Paragraph("No items entered.", s['body']))
+        if sec.get('prc'):
+            story += [Spacer(1, 0.1 * inch), _table(ladder_rows(sec['prc']), LADDER_STYLE, [3 * inch, 1.5 * inch])]
+        story.append(Spacer(1, 0.2 * inch))
+
+    story += [Paragraph("Terms", s['h2']), Paragraph(terms, s['body']),
+              Paragraph("Stone Veneer Guidelines", s['h3'])]
+    story += [Paragraph(g, s['small']) for g in guidelines]
+    story += [Paragraph("Stone Veneer Job Minimums", s['h3']), _table(stone_min, GRID_STYLE),
+              Paragraph("Stucco Painting Minimums", s['h3']), _table(stucco_min, GRID_STYLE)]
+    doc.build(story)
+    buf.seek(0)
+    return buf
+
+
+def submit_estimate(est):
+    return _pool.submit(render_estimate, est)
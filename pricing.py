@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+import dims
+import money
+from catalog import get_catalog
+
+GUTTER_COLS = {'gutters': 'Gutter Type', 'leaders': 'Leader Type', 'guards': 'Guard Type'}
+
+LINE_COLS = ['item', 'category', 'qty', 'price', 'total']
+
+
+def num(s):
+    # Grid quantities are nullable Float64; typed text is parsed. Either way
+    # the result is plain float64 on the 1/10,000 grid money.qty prices at.
+    return pd.to_numeric(s, errors='coerce').astype('float64').round(4)
+
+
+def length(s):
+    # Width and Height hold text such as 12'6"; numeric columns are already feet.
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        return num(s)
+    return pd.Series(dims.parse(s)[0], index=s.index)
+
+
+def wall_sf(walls):
+    return (length(walls['Width']) * length(walls['Height'])).fillna(0)
+
+
+def sum_outs(values):
+    # Outs are typed into free-text boxes as "(120)" or "120"; both deduct 120.
+    s = pd.Series(list(values), dtype=object).astype(str).str.strip('()$ ')
+    return float(num(s).fillna(0).abs().sum())
+
+
+def priced_gutters(m, catalog=None):
+    # Inner join against the catalog: unknown items and items entered under
+    # the wrong category drop out here instead of being checked row by row.
+    m = m.dropna(subset=['item', 'qty'])
+    return m.merge((catalog or get_catalog()).gutters, on=['item', 'category'])
+
+
+def price_lines(parts):
+    """Quantity x rate kernel shared by every service.
+
+    ``parts`` are frames with item, category, qty and price columns. They
+    are stacked, lines without a quantity are dropped and every total is
+    computed in one vectorized fixed-point multiply, rounded to the cent.
+    """
+    lines = pd.concat([p[LINE_COLS[:4]] for p in parts], ignore_index=True)
+    lines['qty'] = num(lines['qty'])
+    lines['price'] = num(lines['price'])
+    lines = lines[lines['qty'].fillna(0) != 0].reset_index(drop=True)
+    lines['total'] = money.dollars(money.extend(lines['qty'], lines['price'].fillna(0)))
+    return lines
+
+
+def lines_total(lines):
+    # Line totals are whole cents, so summing them as cents is exact.
+    return money.dollars(int(money.cents(lines['total']).sum()))
+
+
+def editor_lines(df, qty_col, price_col, category):
+    return pd.DataFrame({'item': df['Description'], 'category': category, 'qty': df[qty_col], 'price': df[price_col]})
+
+
+def gutter_table(category, df, catalog=None):
+    """Priced lines for one gutter measurement table, one per item.
+
+    Lines are ``(item, qty, price, total)`` tuples. Within one table the
+    category is fixed, so the catalog join reduces to a membership test and
+    a price lookup per distinct item. Tables are a few dozen rows, where
+    building frames costs several times the pricing, so the rows are summed
+    in a plain loop and each line is extended on its own.
+    """
+    catalog = catalog or get_catalog()
+    known = catalog.by_category[category]
+    lf = df['LF']
+    lf = lf.to_numpy('float64', na_value=np.nan).round(4) if pd.api.types.is_numeric_dtype(lf.dtype) else num(lf).to_numpy()
+    qty = {}
+    for item, q in zip(df[GUTTER_COLS[category]].tolist(), lf.tolist()):
+        if q == q and item in known:
+            qty[item] = qty.get(item, 0) + q
+    lines = []
+    for item, q in zip(qty, np.round(list(qty.values()), 4).tolist()):
+        if q:
+            price = float(catalog.price[item])
+            lines.append((item, q, price, money.dollars(money.extend(q, price))))
+    return tuple(lines)
+
+
+def combine_gutters(subs, catalog=None):
+    # Every item belongs to one category, so the per-table lines together are
+    # the job's lines.
+    lines = [line for c in GUTTER_COLS if c in subs for line in subs[c]]
+    tots = {item: {'qty': q, 'price': price, 'total': total} for item, q, price, total in lines}
+    return tots, money.dollars(sum(money.cents(line[3]) for line in lines))
+
+
+def gutter_totals(measurements, catalog=None):
+    return combine_gutters({c: gutter_table(c, df, catalog) for c, df in measurements.items()}, catalog)
+
+
+def gutter_minimum(sub, combined=False, catalog=None):
+    """Cents that bring ``sub`` cents of gutter work up to the gutter job minimum.
+
+    ``combined`` picks the minimum for a job that also has another service on
+    it. An empty job, or one already at the minimum, gets nothing. ``sub``
+    may be an int64 array.
+    """
+    catalog = catalog or get_catalog()
+    short = money.cents(float(catalog.gutter_minimums['combined' if combined else 'stand_alone'])) - sub
+    return short * ((sub > 0) & (short > 0))
+
+
+def calc_pricing(sub, rep=False, rig=False):
+    """The discount ladder from 1-year price down to the final sell price.
+
+    Worked in whole cents by ``money.ladder``, which documents the rounding
+    at each step; every amount returned is a whole number of cents. ``sub``,
+    ``rep`` and ``rig`` may also be NumPy arrays that broadcast together.
+    """
+    return {k: money.dollars(v) for k, v in money.ladder(money.cents(sub), rep, rig).items()}
+
+
+def ladder_rows(prc):
+    rows = [['1 Year Price', f"${prc['y1']:.2f}"], ['Deduct 10%', f"(${prc['d1']:.2f})"], ['30 Day Price', f"${prc['d30']:.2f}"], ['Deduct 10%', f"(${prc['d2']:.2f})"], ['Day of Price', f"${prc['dof']:.2f}"], ['Deduct 3% for 33% Deposit', f"(${prc['d3']:.2f})"]]
+    if prc['rep']:
+        rows.append(['Repair', f"${prc['rep']:.2f}"])
+    if prc['rig']:
+        rows.append(['Rigging', f"${prc['rig']:.2f}"])
+    return rows + [['FINAL SELL PRICE', f"${prc['fin']:.2f}"]]
+
+
+def line_rows(lines):
+    return [[r.item, f"{r.qty:.2f}", f"${r.price:.2f}", f"${r.total:.2f}"] for r in lines.itertuples(index=False)]
@@ -0,0 +1,77 @@
+"""Side-by-side quote options for a gutter job.
+
+A scenario re-prices the measured job with some gutter, leader or guard
+types swapped, and with or without repair and rigging. A swap prices all
+of a category's measured type LF at one alternative rate. Add-on lines such
+as extra gauge and strap hangers keep their own rates.
+
+Swaps in different categories touch different lines, so each swap moves the
+subtotal by its own fixed amount of cents:
+
+    sub[g, l, d] = base + dg[g] + dl[l] + dd[d]
+
+The matrix is built by broadcasting the per-category deltas against each
+other and against the repair and rigging flags. The whole grid then goes
+through ``money.ladder`` in one integer array pass. Even a few thousand combinations
+are a handful of array operations.
+"""
+import numpy as np
+import pandas as pd
+
+import money
+from catalog import get_catalog
+from pricing import gutter_minimum
+
+AS_MEASURED = 'As measured'
+
+# The interchangeable types in each category. Anything else in the category
+# is an add-on and is never swapped.
+TYPES = {
+    'gutters': ['Gutter 5" white', 'Gutter 5" all colors', 'Gutter 6" white', 'Gutter 6" all colors'],
+    'leaders': ['Leaders 2x3 white', 'Leaders 2x3 all colors', 'Leader 2x3 white - PVC', 'Leaders 3x4 white', 'Leaders 3x4 all colors',
+                'Leader 3" Round Corrugated - White'],
+    'guards': ['Shur-flow 5" (white)', 'Shur-flow 5" (black or aluminum)', 'Shur-flow 6" (white)', 'Shur-flow 6" (black or aluminum)',
+               'Screen 5"', 'Screen 6"', 'Leafshelter 6" - White', 'Leafshelter 6" - All Colors'],
+}
+
+LADDER = ['y1', 'd30', 'dof', 'fin']
+
+
+def swap_deltas(tots, category, choices, catalog=None):
+    """Subtotal change in cents for pricing ``category``'s measured type LF at each of ``choices``.
+
+    ``tots`` is the ``{item: {'qty', 'price', 'total'}}`` map from the gutter
+    engine. A category with no measured type LF has nothing to swap, and every
+    choice moves the subtotal by zero.
+    """
+    catalog = catalog or get_catalog()
+    measured = [tots[i] for i in TYPES[category] if i in tots]
+    lf = sum(money.qty(t['qty']) for t in measured)
+    cost = sum(money.cents(t['total']) for t in measured)
+    return money.div_round(lf * money.cents(np.array([catalog.price[c] for c in choices], dtype=float)), money.QTY) - cost
+
+
+def matrix(tots, sub, swaps=None, rep=(False,), rig=(False,), catalog=None, combined=False):
+    """Ladder prices for every combination of swaps and add-ons.
+
+    ``swaps`` maps a category to the alternative types to compare. The
+    measured job is always the first option in each category. One row is
+    returned per combination, with the option labels, the repair and rigging
+    flags and the 1-year, 30-day, day-of and final prices, in product order.
+    Each option is brought up to the gutter job minimum (the combined one
+    with ``combined``) before its ladder.
+    """
+    catalog = catalog or get_catalog()
+    swaps = {c: [AS_MEASURED] + [t for t in (swaps or {}).get(c, ()) if t in TYPES[c] and t in catalog.price] for c in TYPES}
+    axes = [np.concatenate([[0], swap_deltas(tots, c, opts[1:], catalog)]).astype(np.int64) for c, opts in swaps.items()]
+    # Flags as 0/1 integers: np.ix_ would read boolean arrays as masks.
+    axes += [np.array(rep, np.int64), np.array(rig, np.int64)]
+    grid = np.ix_(*axes)
+    y1 = money.cents(sub) + sum(grid[:len(TYPES)])
+    prc = money.ladder(y1 + gutter_minimum(y1, combined, catalog), grid[-2], grid[-1])
+    shape = np.broadcast_shapes(*(a.shape for a in grid))
+    out = pd.MultiIndex.from_product(list(swaps.values()) + [list(rep), list(rig)], names=list(TYPES) + ['repair', 'rigging']).to_frame(index=False)
+    for k in LADDER:
+        out[k] = money.dollars(np.broadcast_to(prc[k], shape).ravel())
+    return out
+
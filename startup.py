@@ -0,0 +1,70 @@
+"""One-time process initialisation.
+
+Streamlit re-executes app.py on every rerun, but a module it imports runs
+once per process. Work that does not depend on the session lives here: the
+page settings and CSS, the list of tab inputs and the rate-card catalog.
+PDF code is deliberately not imported; app.py loads it on the first
+"Generate PDF".
+"""
+from catalog import get_catalog
+from painting import OUTS_KEYS as PAINTING_OUTS
+from stucco import OUTS_KEYS as STUCCO_OUTS
+
+PAGE = {'page_title': "Garden State Brickface & Siding Pricing Calculator", 'page_icon': "🏗️", 'layout': "wide"}
+
+CSS = """
+<style>
+.stApp {
+background-color: #FFFFFF;
+color: #000000;
+}
+.stTextInput input, .stNumberInput input, .stSelectbox select {
+background-color: #F0F2F6;
+color: #000000;
+}
+.stDataFrame, [data-testid="stDataFrame"] {
+background-color: #FFFFFF;
+}
+.stDataFrame table {
+background-color: #F0F2F6 !important;
+}
+.stDataFrame thead tr th {
+background-color: #E8EAF0 !important;
+color: #000000 !important;
+}
+.stDataFrame tbody tr {
+background-color: #F0F2F6 !important;
+}
+h1, h2, h3, h4, h5, h6, .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
+color: #000000 !important;
+}
+.stTabs [data-baseweb="tab-list"] {
+background-color: #F0F2F6;
+}
+.stTabs [data-baseweb="tab"] {
+color: #000000;
+}
+.stButton button {
+background-color: #FF4B4B;
+color: #FFFFFF;
+}
+[data-testid="stMetricValue"] {
+color: #000000;
+}
+p, span, label {
+color: #000000 !important;
+}
+hr {
+border-color: #E0E0E0;
+}
+</style>
+"""
+
+# Widget keys on the service tabs whose values outlive the tab being closed.
+TAB_INPUTS = STUCCO_OUTS + PAINTING_OUTS + ['stone_zone', 'st_rep', 'st_rig', 'p_substrate', 'p_shutters_rr', 'p_shutters_paint', 'p_rep', 'p_rig']
+
+
+def load_catalog():
+    # Shared by every session in the process and swapped when ratecard.json
+    # changes. app.py fetches it once per run and prices the whole run with it.
+    return get_catalog()
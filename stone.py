@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from catalog import STONE_LF_TABLES, get_catalog
+from pricing import LINE_COLS, editor_lines, lines_total, num, price_lines, wall_sf
+
+# Area tables and the typed-total column used where Width x Height is blank.
+AREA_TABLES = {'flats': 'Total SF', 'outs': 'Total'}
+
+
+def area(df, total_col):
+    # Width x Height where both were entered, otherwise the typed total.
+    sf = wall_sf(df)
+    return sf.where(sf > 0, num(df[total_col]).fillna(0))
+
+
+def round_even(lf):
+    return 2 * np.ceil(np.asarray(lf, dtype=float) / 2)
+
+
+def debris_tier(squares, rules):
+    """Return ``(stone_debris row, count)`` for the demolition squares."""
+    i = max(int(np.searchsorted(rules.debris_floors, squares, side='right')) - 1, 0)
+    count = math.ceil(squares / rules.debris_cap) if squares > rules.debris_cap else 1
+    return int(rules.debris_rows[i]), count
+
+
+def table_subtotal(name, df, catalog=None):
+    """Reduce one stone table to what the job total needs from it."""
+    if name in AREA_TABLES:
+        return float(area(df, AREA_TABLES[name]).sum())
+    if name in STONE_LF_TABLES:
+        return float(num(df['LF']).sum())
+    if name == 'demolition':
+        return price_lines([editor_lines(df, 'Per Square', 'Price', 'demolition')]), float(num(df['Per Square']).fillna(0).sum())
+    if name == 'misc':
+        return price_lines([editor_lines(df, 'SF/LF/Q', 'Price', 'misc')])
+    return None
+
+
+def combine(subs, catalog=None, zone=0):
+    """Price a stone veneer job from its table subtotals.
+
+    Flats less 100% outs, corners and sills rounded up to even feet,
+    demolition per square, the debris tier for those squares and misc items.
+    A job under its zone minimum gets an adjustment line up to the minimum.
+    ``zone`` indexes the stone_minimums rows. Returns ``(lines, info,
+    subtotal)``.
+    """
+    catalog = catalog or get_catalog()
+    rules = catalog.stone_rules
+    flats, outs = subs['flats'], subs['outs']
+    net = math.ceil(max(flats - outs, 0))
+    lf = {t: subs[t] for t in STONE_LF_TABLES}
+    for t in rules.round_even & lf.keys():
+        lf[t] = float(round_even(lf[t]))
+    demo, demo_sq = subs['demolition']
+
+    parts = [
+        pd.DataFrame({'item': [r[0] for r in catalog.tables['stone_items']], 'category': 'stone', 'qty': [net, lf['corners'], lf['sills']], 'price': catalog.stone_item_rates}),
+        demo,
+        subs['misc'],
+    ]
+    lines = price_lines(parts)
+    debris = None
+    if len(lines):
+        # Debris removal is required on every job, demo or not.
+        debris = debris_tier(demo_sq, rules)
+        row, count = debris
+        parts.append(pd.DataFrame([[catalog.tables['stone_debris'][row][0], 'debris', count, catalog.stone_debris_rates[row]]], columns=LINE_COLS[:4]))
+        lines = price_lines(parts)
+    sub = lines_total(lines)
+    minimum = float(rules.minimums[zone])
+    if 0 < sub < minimum:
+        lines = price_lines([lines, pd.DataFrame([[f"Job minimum - {catalog.tables['stone_minimums'][zone][0]}", 'minimum', 1, minimum - sub]], columns=LINE_COLS[:4])])
+        sub = minimum
+    info = {'flats_sf': flats, 'outs_sf': outs, 'net_sf': net, 'corners_lf': lf['corners'], 'sills_lf': lf['sills'], 'demo_squares': demo_sq,
+            'debris': debris, 'minimum': minimum}
+    return lines, info, sub
+
+
+def stone_totals(meas, pricing, zone=0, catalog=None):
+    """Price a stone veneer job. See :func:`combine`."""
+    return combine({name: table_subtotal(name, df, catalog) for name, df in {**meas, **pricing}.items()}, catalog, zone)
@@ -0,0 +1,231 @@
+"""Saved estimates in a local SQLite database.
+
+One row per saved quote. The searchable fields are plain indexed columns,
+and everything needed to reopen the quote is stored as JSON:
+
+* ``state``     measurement grids, editable pricing tables and tab inputs
+* ``sections``  the priced sections exactly as they went on the estimate,
+                including each ``calc_pricing`` ladder and the numeric
+                line values
+
+``ratecard`` records the rate-card version the quote was priced with.
+
+The database runs in WAL mode, so searches never wait on a save. Saves go
+through a queue to a single writer thread. That thread serialises the frames
+and commits whatever has queued up in one transaction, so pressing Save costs
+a rerun only a queue put. ``save`` returns a Future that resolves to the new
+estimate id.
+
+Reads borrow a connection from a per-process pool. Name, address and rep
+searches are case-insensitive prefix matches served by the NOCASE indexes.
+``scan`` pages through whole estimates by id for bulk export.
+
+    PRICING_DB=estimates.db   database path (the default)
+"""
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+PATH = os.environ.get('PRICING_DB', 'estimates.db')
+BATCH = 200
+LINGER = 0.05
+LIMIT = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS estimates (
+    id              INTEGER PRIMARY KEY,
+    created         TEXT NOT NULL,
+    customer_name   TEXT NOT NULL COLLATE NOCASE,
+    project_address TEXT NOT NULL COLLATE NOCASE,
+    sales_rep       TEXT NOT NULL COLLATE NOCASE,
+    total           REAL NOT NULL,
+    ratecard        TEXT,
+    state           TEXT NOT NULL,
+    sections        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS estimates_customer ON estimates (customer_name);
+CREATE INDEX IF NOT EXISTS estimates_address ON estimates (project_address);
+CREATE INDEX IF NOT EXISTS estimates_rep ON estimates (sales_rep);
+CREATE INDEX IF NOT EXISTS estimates_created ON estimates (created);
+"""
+
+INSERT = ('INSERT INTO estimates (created, customer_name, project_address, sales_rep, total, ratecard, state, sections) '
+          'VALUES (?, ?, ?, ?, ?, ?, ?, ?)')
+SUMMARY = ['id', 'created', 'customer_name', 'project_address', 'sales_rep', 'total', 'ratecard']
+
+_pool = queue.LifoQueue()
+_schema = set()
+_lock = threading.Lock()
+_writer = None
+
+
+def connect(path=None):
+    path = path or PATH
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    with _lock:
+        if path not in _schema:
+            conn.executescript(SCHEMA)
+            # Databases from before rate-card versions were recorded.
+            if 'ratecard' not in {r[1] for r in conn.execute('PRAGMA table_info(estimates)')}:
+                conn.execute('ALTER TABLE estimates ADD COLUMN ratecard TEXT')
+            _schema.add(path)
+    return conn
+
+
+@contextmanager
+def connection():
+    """A pooled read connection. The pool grows to the number of concurrent readers."""
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = connect()
+    try:
+        yield conn
+    finally:
+        _pool.put(conn)
+
+
+def _frame_json(obj):
+    if isinstance(obj, pd.DataFrame):
+        return json.loads(obj.to_json(orient='split', index=False))
+    raise TypeError(f'{type(obj).__name__} is not JSON serializable')
+
+
+def _row(rec):
+    c = rec['customer']
+    return (rec.get('created') or datetime.now().isoformat(timespec='seconds'), c['customer_name'], c['project_address'], c['sales_rep'],
+            sum(s['prc']['fin'] for s in rec['sections'] if s.get('prc')), rec.get('ratecard'), json.dumps(rec['state'], default=_frame_json), json.dumps(rec['sections']))
+
+
+class _Writer(threading.Thread):
+    def __init__(self):
+        super().__init__(name='estimate-store', daemon=True)
+        self.jobs = queue.Queue()
+
+    def run(self):
+        conn = connect()
+        while True:
+            batch = [self.jobs.get()]
+            try:
+                while len(batch) < BATCH:
+                    batch.append(self.jobs.get(timeout=LINGER))
+            except queue.Empty:
+                pass
+            stop = None in batch
+            self.write(conn, [job for job in batch if job is not None])
+            if stop:
+                conn.close()
+                return
+
+    def write(self, conn, batch):
+        if not batch:
+            return
+        try:
+            rows = [_row(rec) for rec, _ in batch]
+            conn.execute('BEGIN IMMEDIATE')
+            ids = [conn.execute(INSERT, row).lastrowid for row in rows]
+            conn.execute('COMMIT')
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            for _, fut in batch:
+                fut.set_exception(e)
+            return
+        for (_, fut), i in zip(batch, ids):
+            fut.set_result(i)
+
+    def close(self):
+        self.jobs.put(None)
+        self.join(timeout=10)
+
+
+def save(rec):
+    """Queue ``rec`` for writing and return a Future of its estimate id.
+
+    ``rec`` is ``{'customer', 'sections', 'state'[, 'ratecard', 'created']}``.
+    Frames in ``state`` are serialised on the writer thread, so they must not
+    be mutated in place afterwards; the app only ever replaces them.
+    """
+    global _writer
+    with _lock:
+        if _writer is None:
+            _writer = _Writer()
+            _writer.start()
+            atexit.register(_writer.close)
+    fut = Future()
+    _writer.jobs.put((rec, fut))
+    return fut
+
+
+def search(text='', since=None, until=None, limit=LIMIT):
+    """Newest saved estimates whose customer, address or rep starts with ``text``."""
+    where, args = [], []
+    if text:
+        pat = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        where.append("(customer_name LIKE ? ESCAPE '\\' OR project_address LIKE ? ESCAPE '\\' OR sales_rep LIKE ? ESCAPE '\\')")
+        args += [pat] * 3
+    if since:
+        where.append('created >= ?')
+        args.append(since)
+    if until:
+        where.append('created < ?')
+        args.append(until)
+    sql = f"SELECT {', '.join(SUMMARY)} FROM estimates {'WHERE ' + ' AND '.join(where) if where else ''} ORDER BY created DESC LIMIT ?"
+    with connection() as conn:
+        return pd.DataFrame(conn.execute(sql, args + [limit]).fetchall(), columns=SUMMARY)
+
+
+def scan(since=None, until=None, size=500):
+    """Saved estimates in id order, ``size`` rows at a time, as raw rows.
+
+    Each row is the ``SUMMARY`` columns followed by the ``state`` and
+    ``sections`` JSON text, left unparsed. Pages are fetched by id, so no read
+    is held open between pages and saves made meanwhile are not blocked.
+    """
+    where, args = ['id > ?'], [0]
+    if since:
+        where.append('created >= ?')
+        args.append(since)
+    if until:
+        where.append('created < ?')
+        args.append(until)
+    sql = f"SELECT {', '.join(SUMMARY)}, state, sections FROM estimates WHERE {' AND '.join(where)} ORDER BY id LIMIT ?"
+    while True:
+        with connection() as conn:
+            rows = conn.execute(sql, args + [size]).fetchall()
+        if not rows:
+            return
+        yield rows
+        args[0] = rows[-1][0]
+
+
+def _frames(obj):
+    if isinstance(obj, dict) and obj.keys() == {'columns', 'data'}:
+        return pd.DataFrame(obj['data'], columns=obj['columns'])
+    if isinstance(obj, dict):
+        return {k: _frames(v) for k, v in obj.items()}
+    return obj
+
+
+def load(estimate_id):
+    """The saved estimate ``{'id', 'created', 'customer', 'total', 'ratecard', 'state', 'sections'}``, or None.
+
+    Frames come back with JSON dtypes; callers cast them to their live dtypes.
+    """
+    with connection() as conn:
+        row = conn.execute(f"SELECT {', '.join(SUMMARY)}, state, sections FROM estimates WHERE id = ?", (estimate_id,)).fetchone()
+    if row is None:
+        return None
+    i, created, name, addr, rep, total, ratecard, state, sections = row
+    return {'id': i, 'created': created, 'customer': {'customer_name': name, 'project_address': addr, 'sales_rep': rep},
+            'total': total, 'ratecard': ratecard, 'state': _frames(json.loads(state)), 'sections': json.loads(sections)}
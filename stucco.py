@@ -0,0 +1,111 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from catalog import get_catalog
+from pricing import LINE_COLS, editor_lines, length, lines_total, num, price_lines, wall_sf
+
+# Trim tables priced per LF/side against the loxon_trim rows; window and door
+# trim share the first row. Other trim has no rate on the card and is not
+# priced.
+TRIM_TABLES = {'window_trim': ('LF', 0), 'door_trim': ('LF', 0), 'soffit': ('LF', 1), 'fascia': ('LF', 2), 'quions': ('Quantity', 3)}
+
+# Pricing editors and the quantity column priced against their PRICE column.
+EDITORS = {'caulking': 'LF', 'misc': 'Quantity'}
+
+OUTS_KEYS = ['stucco_front_outs', 'stucco_front_right_outs', 'stucco_rear_outs', 'stucco_front_left_outs']
+
+# stucco_minimums rows by the work they cover. Loxon walls and trim take the
+# LOXON row. A job without them takes the caulking row if caulking is priced
+# and the row of each stucco_misc item priced, whichever is largest.
+LOXON_MINIMUM = 0
+EDITOR_MINIMUMS = {'caulking': 6}
+# stucco_misc row -> stucco_minimums row: BCMA, clear sealer, spot and full pointing.
+MISC_MINIMUMS = {1: 3, 8: 1, 11: 4, 12: 5}
+
+# Wall area above this height takes the above-8' (ladder) rates, and the
+# area below it takes the below-8' (ground work) rates.
+LADDER_HEIGHT = 8
+
+
+def loxon_tier(sf, catalog=None):
+    # Tier floors are sorted, so the tier is the last floor <= sf. Anything
+    # under the first floor is billed at the first tier.
+    tiers = (catalog or get_catalog()).loxon_tiers
+    return np.maximum(np.searchsorted(tiers, sf, side='right') - 1, 0)
+
+
+def table_subtotal(name, df, catalog=None):
+    """Reduce one stucco table to what the job total needs from it."""
+    if name == 'walls':
+        # (SF below the 8' line, SF above it), summed over the walls.
+        width, height = length(df['Width']), length(df['Height'])
+        below = (width * height.clip(upper=LADDER_HEIGHT)).fillna(0)
+        return float(below.sum()), float((wall_sf(df) - below).sum())
+    if name in TRIM_TABLES:
+        return float(num(df[TRIM_TABLES[name][0]]).sum())
+    if name in EDITORS:
+        return price_lines([editor_lines(df, EDITORS[name], 'PRICE', name)])
+    return None
+
+
+def minimum_row(lines, catalog=None):
+    """The stucco_minimums row for the work in ``lines``, or None if no minimum covers it."""
+    catalog = catalog or get_catalog()
+    cats = set(lines['category'])
+    if cats & {'walls', 'trim'}:
+        return LOXON_MINIMUM
+    rows = [row for name, row in EDITOR_MINIMUMS.items() if name in cats]
+    misc = set(lines.loc[lines['category'] == 'misc', 'item'])
+    rows += [row for i, row in MISC_MINIMUMS.items() if catalog.tables['stucco_misc'][i][0] in misc]
+    return max(rows, key=lambda r: catalog.stucco_minimums[r], default=None)
+
+
+def combine(subs, catalog=None, outs=0):
+    """Price a stucco job from its table subtotals.
+
+    Wall SF less outs is rounded up to full squares and billed at the Loxon
+    tier for that SF. Each wall's SF is split at the 8' line, and the billed
+    SF is shared between the two bands in proportion to their wall area (to
+    the whole SF): the part above 8' takes the above-8' rates and the rest
+    the below-8' rates. A job under the minimum for its kind of work (see
+    ``minimum_row``) gets an adjustment line up to the minimum. Returns
+    ``(lines, info, subtotal)``.
+    """
+    catalog = catalog or get_catalog()
+    below, above = subs['walls']
+    gross = below + above
+    net = max(gross - outs, 0)
+    squares = math.ceil(net / 100)
+    high = round(squares * 100 * above / gross) if gross else 0
+    billed = {'below': squares * 100 - high, 'above': high}
+    tier = int(loxon_tier(squares * 100, catalog))
+
+    parts = []
+    for band, sf in billed.items():
+        if sf:
+            label = catalog.frames['loxon_' + band].at[tier, 'SF RANGE']
+            parts.append(pd.DataFrame([[f"Loxon XP walls ({band} 8', {label} SF)", 'walls', sf, catalog.loxon_rates[band][tier]]], columns=LINE_COLS[:4]))
+
+    trim_qty = np.zeros(len(catalog.loxon_trim_rates))
+    for name, (_, i) in TRIM_TABLES.items():
+        trim_qty[i] += subs[name]
+    parts.append(pd.DataFrame({'item': [r[0] for r in catalog.tables['loxon_trim']], 'category': 'trim', 'qty': trim_qty, 'price': catalog.loxon_trim_rates}))
+    parts += [subs[name] for name in EDITORS]
+
+    lines = price_lines(parts)
+    sub = lines_total(lines)
+    row = minimum_row(lines, catalog)
+    minimum = 0.0 if row is None else float(catalog.stucco_minimums[row])
+    if 0 < sub < minimum:
+        lines = price_lines([lines, pd.DataFrame([[f"Job minimum - {catalog.tables['stucco_minimums'][row][0]}", 'minimum', 1, minimum - sub]], columns=LINE_COLS[:4])])
+        sub = minimum
+    info = {'gross_sf': gross, 'outs': outs, 'net_sf': net, 'squares': squares, 'billed_sf': squares * 100, 'below_sf': billed['below'], 'above_sf': billed['above'],
+            'tier': tier, 'minimum': minimum}
+    return lines, info, sub
+
+
+def stucco_totals(meas, pricing, outs=0, catalog=None):
+    """Price a stucco job. See :func:`combine`."""
+    return combine({name: table_subtotal(name, df, catalog) for name, df in {**meas, **pricing}.items()}, catalog, outs)
@@ -0,0 +1,44 @@
+import queue
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# The app's modules live flat in the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# $47/LF on the built-in card; 8191.91 LF of it is exactly $385,019.77.
+LEADER = 'Leader 3" Round Corrugated - White'
+LEADER_LF = 8191.91
+
+
+@pytest.fixture
+def leader():
+    return LEADER
+
+
+@pytest.fixture
+def leader_lf():
+    return LEADER_LF
+
+
+@pytest.fixture
+def leaders():
+    """A leaders grid with one row of the leader per value of ``lf``."""
+    def make(lf=(LEADER_LF,)):
+        lf = lf if hasattr(lf, 'dtype') else list(lf)
+        return pd.DataFrame({'Location': 'FRONT', 'Leader Type': LEADER, 'LF': lf})
+    return make
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the store at an empty database with its own pool and writer."""
+    import store
+    monkeypatch.setattr(store, 'PATH', str(tmp_path / 'estimates.db'))
+    monkeypatch.setattr(store, '_pool', queue.LifoQueue())
+    monkeypatch.setattr(store, '_writer', None)
+    yield store.PATH
+    if store._writer is not None:
+        store._writer.close()
@@ -0,0 +1,45 @@
+import logging
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import store
+
+APP = str(Path(__file__).resolve().parents[1] / 'app.py')
+
+
+@pytest.fixture
+def app(db, monkeypatch):
+    for name in ('streamlit.deprecation_util', 'streamlit.runtime.scriptrunner_utils.script_run_context', 'streamlit.elements.widgets.data_editor'):
+        monkeypatch.setattr(logging.getLogger(name), 'disabled', True)
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.session_state['g_ed'] = {'edited_rows': {}, 'added_rows': [{'Location': 'FRONT', 'Gutter Type': 'Gutter 5" white', 'LF': 40}], 'deleted_rows': []}
+    at.run()
+    for label, value in [('Customer Name', 'Test'), ('Project Address', '1 Elm St'), ('Sales Representative', 'Rep')]:
+        next(w for w in at.text_input if w.label == label).input(value)
+    return at.run()
+
+
+def test_generate_pdf_does_not_save_the_estimate(app):
+    next(b for b in app.button if b.label == 'Generate PDF').click()
+    app.run()
+    assert not app.exception
+    assert 'pdf_job' in app.session_state
+    assert 'save_job' not in app.session_state
+    next(b for b in app.button if b.label == '💾 Save Estimate').click()
+    app.run()
+    assert app.session_state['save_job'].result(timeout=10) == 1
+    assert len(store.search()) == 1
+
+
+def test_job_summary_follows_tab_edits(app):
+    app.session_state['job_summary'] = True
+    app.run()
+    assert [m.value for m in app.metric if m.label == 'Gutters and Leaders'] == ['$1,150.00']
+    app.session_state['g_ed'] = {'edited_rows': {0: {'LF': 400}}, 'added_rows': [], 'deleted_rows': []}
+    app.run()
+    assert not app.exception
+    assert [m.value for m in app.metric if m.label == 'Gutters and Leaders'] == ['$5,200.00']
+    assert app.session_state['summary_key'][0] == (('gutters', 5200.0),)
@@ -0,0 +1,31 @@
+import pandas as pd
+
+import batch
+import estimate
+from catalog import get_catalog
+from pricing import gutter_totals
+
+
+def _app(rows, rep=False, rig=False):
+    # What the app quotes: the gutters tab's grid through the combined estimate.
+    catalog = get_catalog()
+    tots, _ = gutter_totals({'gutters': pd.DataFrame(rows)}, catalog)
+    return estimate.combine({'gutters': estimate.gutter_lines(tots, catalog)}, rep, rig, catalog)[2]
+
+
+def test_sub_minimum_job_prices_as_the_app_quotes_it():
+    rows = [{'Gutter Type': 'Gutter 5" white', 'LF': 20}]
+    got = batch.price_jobs([{'job_id': '7', 'gutters': rows, 'rig': 'yes'}])[0]
+    want = _app(rows, rig=True)
+    assert got['subtotal'] == want['y1'] == 1150
+    assert {k: got[k] for k in want} == want
+
+
+def test_jobs_in_one_batch_price_independently():
+    small = [{'Gutter Type': 'Gutter 5" white', 'LF': 20}]
+    large = [{'Gutter Type': 'Gutter 6" white', 'LF': 300.5}]
+    got = batch.price_jobs([{'job_id': 'a', 'gutters': small}, {'job_id': 'b'}, {'job_id': 'c', 'gutters': large}])
+    assert [r['job_id'] for r in got] == ['a', 'b', 'c']
+    assert got[0]['fin'] == _app(small)['fin']
+    assert got[1]['fin'] == 0
+    assert got[2]['fin'] == _app(large)['fin']
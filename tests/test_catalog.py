@@ -0,0 +1,36 @@
+import copy
+
+import pytest
+
+from catalog import BUILTIN_CARD, validate_card
+
+
+def _card(**rules):
+    card = copy.deepcopy(BUILTIN_CARD)
+    card['stone_rules'].update(rules)
+    return card
+
+
+def test_builtin_card_is_valid():
+    validate_card(BUILTIN_CARD)
+
+
+@pytest.mark.parametrize('rules', [
+    {'debris': [[0, 0], [4, 1], [11, 3]]},
+    {'debris': [[0, -1]]},
+    {'debris': [[0, 1.0]]},
+    {'debris': []},
+    {'round_even': ['corners', 'flats']},
+    {'debris_cap': 0},
+    {'minimums': [7500, -1, 9500]},
+])
+def test_stone_rules_out_of_range_are_rejected(rules):
+    with pytest.raises(ValueError, match='stone_rules'):
+        validate_card(_card(**rules))
+
+
+def test_stucco_minimum_must_be_a_dollar_amount():
+    card = copy.deepcopy(BUILTIN_CARD)
+    card['stucco_minimums'][0][1] = 'call us'
+    with pytest.raises(ValueError, match='dollar amount'):
+        validate_card(card)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import dims
+
+CASES = [
+    ('12', 12), ('12.5', 12.5), ('.5', 0.5), (' 12 ', 12), ("12'", 12), ('12 ft', 12), ('12 feet', 12),
+    ('12\'6"', 12.5), ('12\' 6"', 12.5), ("12'-6", 12.5), ("12'6", 12.5), ('12 6', 12.5), ('12’6”', 12.5),
+    ('6"', 0.5), ('6 in', 0.5), ('6 1/2"', 0.5417), ('12\' 6 1/2"', 12.5417), ('12 1/2', 12.5),
+    ('13"', 1.0833), ("12' 11.5\"", 12.9583), ('0', 0),
+]
+BAD = ['1e3', '1E3', 'inf', 'nan', '-3', '+3', '12\' 13"', "12'12", '12 13', "5' 12 1/2\"", '5.5.5', 'abc', '12"6\'', '1/0']
+
+
+@pytest.mark.parametrize('text, feet', CASES)
+def test_dimension_parses_to_feet(text, feet):
+    got, bad = dims.parse([text])
+    assert not bad[0]
+    assert got[0] == feet
+
+
+@pytest.mark.parametrize('text', BAD)
+def test_non_dimension_is_flagged(text):
+    got, bad = dims.parse([text])
+    assert bad[0]
+    assert np.isnan(got[0])
+
+
+def test_column_is_parsed_in_one_pass_and_blanks_are_not_bad():
+    got, bad = dims.parse([c for c, _ in CASES] + BAD + ['', '  ', None])
+    n = len(CASES)
+    assert got[:n].tolist() == [f for _, f in CASES]
+    assert bad.tolist() == [False] * n + [True] * len(BAD) + [False] * 3
+
+
+def test_measure_fills_totals_and_reports_bad_cells():
+    df = pd.DataFrame({'Width': ["12'6\"", '10', '1e3', None], 'Height': ['8', "12' 13\"", '9', None],
+                       'Total SF': pd.array([None, None, None, 50], dtype='Float64')})
+    out, bad = dims.measure(df, 'Total SF')
+    assert out['Total SF'].tolist()[:1] == [100.0]
+    assert out['Total SF'].isna().tolist()[1:3] == [True, True]
+    assert out['Total SF'].tolist()[3] == 50
+    assert bad.values.tolist() == [[2, 'Width', '1e3'], [1, 'Height', '12\' 13"']]
@@ -0,0 +1,37 @@
+import pandas as pd
+
+import estimate
+import money
+import scenarios
+from catalog import get_catalog
+from pricing import calc_pricing, gutter_minimum, gutter_totals
+
+
+def _gutters(lf):
+    catalog = get_catalog()
+    tots, sub = gutter_totals({'gutters': pd.DataFrame({'Gutter Type': ['Gutter 5" white'], 'LF': [lf]})}, catalog)
+    return tots, sub, estimate.gutter_lines(tots, catalog)
+
+
+def test_gutter_minimum_is_the_same_on_the_tab_the_options_and_the_job():
+    tots, sub, lines = _gutters(20)
+    assert 0 < sub < 650
+    short = gutter_minimum(money.cents(sub))
+    tab = calc_pricing(money.dollars(money.cents(sub) + short))
+    _, subtotals, job = estimate.combine({'gutters': lines})
+    options = scenarios.matrix(tots, sub)
+    assert tab == job
+    assert subtotals['gutters'] == job['y1'] == 1150
+    assert options['fin'].iloc[0] == job['fin']
+
+
+def test_combined_gutter_minimum_applies_with_another_service():
+    _, sub, lines = _gutters(20)
+    other = pd.DataFrame([['Other work', 'misc', 1, 5000.0, 5000.0]], columns=['item', 'category', 'qty', 'price', 'total'])
+    _, subtotals, _ = estimate.combine({'gutters': lines, 'stone': other})
+    assert subtotals['gutters'] == money.dollars(money.cents(sub) + gutter_minimum(money.cents(sub), combined=True)) == 650
+
+
+def test_no_minimum_on_an_empty_or_large_job():
+    assert gutter_minimum(0) == 0
+    assert gutter_minimum(money.cents(2000.0)) == 0
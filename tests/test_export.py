@@ -0,0 +1,30 @@
+import json
+
+import estimate
+import export
+from catalog import get_catalog
+from pricing import gutter_totals
+
+
+def _lines(sections):
+    row = (1, '2025-03-01T09:00:00', 'Cust', '1 Main St', 'Rep', 0.0, None, json.dumps({}), json.dumps(sections))
+    return export.batches([row])['lines'].to_pydict()
+
+
+def test_lines_export_the_saved_numbers_not_the_display(leader, leaders):
+    catalog = get_catalog()
+    tots, _ = gutter_totals({'leaders': leaders([8191.9123])}, catalog)
+    secs = estimate.sections(*estimate.combine({'gutters': estimate.gutter_lines(tots, catalog)}, catalog=catalog))
+    assert [s['kind'] for s in secs] == ['items', 'total']
+    assert secs[0]['lines'][0][1] == '8191.91'
+
+    lines = _lines(secs)
+    assert lines['item'] == [leader]
+    assert lines['qty'] == [8191.9123]
+    assert lines['price'] == [47.0]
+    assert lines['total'] == [385019.88]
+
+    # Sections saved before ``kind`` and ``values`` only have the display text.
+    legacy = [{k: v for k, v in secs[0].items() if k not in ('kind', 'values')}]
+    assert _lines(legacy)['qty'] == [8191.91]
+    assert _lines(legacy)['total'] == [385019.88]
@@ -0,0 +1,10 @@
+import numpy as np
+import pandas as pd
+
+from memo import content_hash
+
+
+def test_missing_cells_do_not_collide_with_text():
+    cells = [None, np.nan, 'nan', 'None', '']
+    digests = {content_hash(pd.DataFrame({'Width': pd.Series([v, '12'], dtype=object)})) for v in cells}
+    assert len(digests) == len(cells)
@@ -0,0 +1,34 @@
+import importlib
+
+import pytest
+
+import metrics
+
+
+@pytest.fixture
+def reload(monkeypatch):
+    def load(value):
+        monkeypatch.setenv('PRICING_METRICS', value)
+        return importlib.reload(metrics)
+    yield load
+    monkeypatch.delenv('PRICING_METRICS', raising=False)
+    importlib.reload(metrics)
+
+
+@pytest.mark.parametrize('value', ['', ' ', '0', 'false', 'False', 'FALSE'])
+def test_off_values_leave_metrics_off(reload, value, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    m = reload(value)
+    assert not m.ENABLED
+    assert m._sink is None
+    assert m.laps('tab') is m.NO_LAPS
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize('value', ['1', 'true', 'TRUE', 'panel'])
+def test_panel_values_record_without_a_file(reload, value, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    m = reload(value)
+    assert m.ENABLED
+    assert m._sink is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+import money
+from pricing import gutter_totals
+
+
+@pytest.fixture
+def ladder(leaders):
+    def price(lf):
+        return money.ladder(money.cents(gutter_totals({'leaders': leaders(lf)})[1]), True, True)
+    return price
+
+
+@pytest.mark.parametrize('lf', [8191.91, 12345.67, 4321.07, 1024.01, 3.3])
+def test_ladder_is_the_same_from_typed_text_and_float_grids(ladder, lf):
+    want = ladder(pd.Series([str(lf)], dtype=object))
+    assert ladder(pd.array([lf], dtype='Float64')) == want
+    assert ladder(pd.Series([lf], dtype='float64')) == want
+
+
+def test_ladder_year_one_is_exact_cents(ladder, leader_lf):
+    # 8,191.91 LF at $47.
+    assert ladder(pd.array([leader_lf], dtype='Float64'))['y1'] == 38501977
@@ -0,0 +1,15 @@
+import batch
+import grids
+from catalog import get_catalog
+from pricing import gutter_totals
+
+
+def test_large_lf_prices_the_same_in_app_and_batch(leader, leader_lf, leaders):
+    # The leader LF is exactly $385,019.77, from the typed grid and from batch
+    # input alike.
+    catalog = get_catalog()
+    tots, app_sub = gutter_totals({'leaders': grids.typed(leaders(), 'leaders', catalog)}, catalog)
+    batch_sub = batch.price_jobs([{'job_id': '1', 'leaders': [{'Leader Type': leader, 'LF': leader_lf}]}])[0]['subtotal']
+    assert catalog.price[leader] == 47
+    assert app_sub == batch_sub == 385019.77
+    assert tots[leader]['qty'] == leader_lf
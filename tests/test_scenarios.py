@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+import scenarios
+from pricing import calc_pricing, gutter_totals
+
+GUTTERS = pd.DataFrame({'Location': ['FRONT', 'REAR'], 'Gutter Type': ['Gutter 5" white', 'Gutter 5" all colors'], 'LF': [120.25, 80.5]})
+LEADERS = pd.DataFrame({'Location': ['FRONT'], 'Leader Type': ['Leaders 2x3 white'], 'LF': [64.33]})
+
+
+def _job(gutter_type=None, leader_type=None):
+    g = GUTTERS.assign(**{'Gutter Type': gutter_type}) if gutter_type else GUTTERS
+    ld = LEADERS.assign(**{'Leader Type': leader_type}) if leader_type else LEADERS
+    return gutter_totals({'gutters': g, 'leaders': ld})
+
+
+def test_swap_delta_is_the_change_in_the_repriced_job():
+    tots, sub = _job()
+    choices = ['Gutter 6" white', 'Gutter 5" white']
+    deltas = scenarios.swap_deltas(tots, 'gutters', choices)
+    assert deltas.tolist() == [round((_job(gutter_type=c)[1] - sub) * 100) for c in choices]
+
+
+def test_nothing_measured_swaps_for_nothing():
+    tots, _ = _job()
+    assert scenarios.swap_deltas(tots, 'guards', ['Screen 5"', 'Screen 6"']).tolist() == [0, 0]
+
+
+def test_matrix_prices_every_combination_like_the_repriced_job():
+    tots, sub = _job()
+    swaps = {'gutters': ['Gutter 6" all colors', 'Not a gutter'], 'leaders': ['Leaders 3x4 white']}
+    m = scenarios.matrix(tots, sub, swaps, rep=(False, True), rig=(False, True))
+    # Unknown types are dropped; the measured job comes first in each category.
+    assert len(m) == 2 * 2 * 1 * 2 * 2
+    first = m.iloc[0]
+    assert (first['gutters'], first['leaders'], first['guards']) == (scenarios.AS_MEASURED,) * 3
+    for r in m.itertuples(index=False):
+        g = None if r.gutters == scenarios.AS_MEASURED else r.gutters
+        ld = None if r.leaders == scenarios.AS_MEASURED else r.leaders
+        want = calc_pricing(_job(g, ld)[1], r.repair, r.rigging)
+        assert [getattr(r, k) for k in scenarios.LADDER] == [want[k] for k in scenarios.LADDER]
+
+
+def test_matrix_options_carry_the_gutter_minimum():
+    tots, sub = gutter_totals({'gutters': GUTTERS.iloc[:1].assign(LF=10)})
+    m = scenarios.matrix(tots, sub, {'gutters': ['Gutter 6" white']})
+    assert np.all(m['y1'] == 1150) and sub < 1150
+    assert scenarios.matrix(tots, sub, combined=True)['y1'].tolist() == [650]
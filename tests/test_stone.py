@@ -0,0 +1,66 @@
+import pytest
+
+import stone
+from catalog import get_catalog
+
+
+def _price(flats=0.0, corners=0.0, sills=0.0, demo_squares=None, zone=0):
+    catalog = get_catalog()
+    pricing = catalog.new_pricing('stone')
+    demo = pricing['demolition']
+    if demo_squares is not None:
+        demo.loc[0, 'Per Square'] = str(demo_squares)
+    subs = {'flats': flats, 'outs': 0.0, 'corners': corners, 'sills': sills,
+            'demolition': stone.table_subtotal('demolition', demo), 'misc': stone.table_subtotal('misc', pricing['misc'])}
+    return stone.combine(subs, catalog, zone)
+
+
+@pytest.mark.parametrize('lf, even', [(0, 0), (1, 2), (2, 2), (2.1, 4), (3, 4), (10.5, 12)])
+def test_round_even(lf, even):
+    assert stone.round_even(lf) == even
+
+
+@pytest.mark.parametrize('squares, tier', [
+    (0, (0, 1)), (3.99, (0, 1)), (4, (1, 1)), (10.99, (1, 1)), (11, (2, 1)), (20, (2, 1)),
+    # Past the cap, one more of the largest dumpster per 20 squares.
+    (20.01, (2, 2)), (40, (2, 2)), (41, (2, 3)),
+])
+def test_debris_tier_boundaries(squares, tier):
+    assert stone.debris_tier(squares, get_catalog().stone_rules) == tier
+
+
+def test_corners_and_sills_round_up_to_even_feet():
+    lines, info, _ = _price(flats=200, corners=11, sills=7)
+    assert (info['corners_lf'], info['sills_lf']) == (12, 8)
+    assert lines.set_index('item').loc['Stone Corners', 'qty'] == 12
+
+
+def test_debris_is_charged_even_without_demolition():
+    lines, info, _ = _price(flats=200)
+    assert info['debris'] == (0, 1)
+    assert lines['category'].tolist().count('debris') == 1
+
+
+def test_demolition_squares_pick_the_dumpster():
+    lines, info, _ = _price(flats=200, demo_squares=12)
+    assert info['debris'] == (2, 1)
+    debris = lines[lines['category'] == 'debris']
+    assert debris['total'].tolist() == [1868]
+
+
+@pytest.mark.parametrize('zone, minimum', [(0, 7500), (1, 8500), (2, 9500)])
+def test_small_job_is_billed_at_its_zone_minimum(zone, minimum):
+    # 50 SF of flats and the under-4-squares debris charge: 2,900 + 830.
+    lines, info, sub = _price(flats=50, zone=zone)
+    assert info['minimum'] == minimum
+    assert sub == minimum == lines['total'].sum()
+    assert lines['total'].iloc[-1] == minimum - 3730
+    assert lines['item'].iloc[-1] == f"Job minimum - {get_catalog().tables['stone_minimums'][zone][0]}"
+
+
+def test_job_over_the_minimum_and_empty_job_have_no_minimum_line():
+    lines, _, sub = _price(flats=200)
+    assert sub == 200 * 58 + 830
+    assert 'minimum' not in set(lines['category'])
+    lines, info, sub = _price()
+    assert (len(lines), sub, info['debris']) == (0, 0, None)
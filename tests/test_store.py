@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+import store
+
+
+def _rec(name, address='1 Elm St', rep='Rep', fin=100.0, created=None, **state):
+    rec = {'customer': {'customer_name': name, 'project_address': address, 'sales_rep': rep},
+           'sections': [{'title': 'Gutters', 'prc': {'fin': fin}}, {'title': 'Notes', 'prc': None}], 'state': state, 'ratecard': 'v1'}
+    return {**rec, 'created': created} if created else rec
+
+
+def test_save_and_load_round_trip_frames_and_sections(db):
+    grid = pd.DataFrame({'Location': ['FRONT'], 'LF': [40.5]})
+    i = store.save(_rec('Smith', fin=1150.0, inputs={'gutters': grid}, flags={'rep': True})).result(timeout=10)
+    est = store.load(i)
+    assert est['customer'] == {'customer_name': 'Smith', 'project_address': '1 Elm St', 'sales_rep': 'Rep'}
+    assert est['total'] == 1150.0
+    assert est['ratecard'] == 'v1'
+    assert est['sections'][0]['prc'] == {'fin': 1150.0}
+    pd.testing.assert_frame_equal(est['state']['inputs']['gutters'], grid)
+    assert est['state']['flags'] == {'rep': True}
+    assert store.load(i + 1) is None
+
+
+def test_saves_queued_together_get_their_own_ids(db):
+    futs = [store.save(_rec(f'Cust {n}')) for n in range(25)]
+    ids = [f.result(timeout=10) for f in futs]
+    assert ids == list(range(1, 26))
+    assert [store.load(i)['customer']['customer_name'] for i in (1, 25)] == ['Cust 0', 'Cust 24']
+
+
+def test_a_failed_save_raises_and_writes_nothing(db):
+    with pytest.raises(TypeError):
+        store.save(_rec('Bad', inputs={'x': object()})).result(timeout=10)
+    assert store.search().empty
+
+
+def test_search_is_a_case_insensitive_prefix_match(db):
+    for rec in [_rec('Smith', created='2025-01-02T09:00:00'), _rec('Jones', address='12 Smithfield Rd', created='2025-02-01T09:00:00'),
+                _rec('50%_off', rep='Ann', created='2025-03-01T09:00:00')]:
+        store.save(rec).result(timeout=10)
+    assert store.search('smi')['customer_name'].tolist() == ['Smith']
+    assert store.search('12 smith')['customer_name'].tolist() == ['Jones']
+    assert store.search('ann')['customer_name'].tolist() == ['50%_off']
+    # LIKE wildcards in the search text are literal.
+    assert store.search('50%_')['customer_name'].tolist() == ['50%_off']
+    assert store.search('5_%').empty
+    # Newest first, within the date range.
+    assert store.search()['customer_name'].tolist() == ['50%_off', 'Jones', 'Smith']
+    assert store.search(since='2025-02-01', until='2025-03-01')['customer_name'].tolist() == ['Jones']
+    assert store.search(limit=1)['customer_name'].tolist() == ['50%_off']
+
+
+def test_scan_pages_through_every_estimate_by_id(db):
+    for n in range(7):
+        store.save(_rec(f'Cust {n}', created=f'2025-01-0{n + 1}T09:00:00')).result(timeout=10)
+    pages = list(store.scan(size=3))
+    assert [len(p) for p in pages] == [3, 3, 1]
+    assert [r[0] for p in pages for r in p] == list(range(1, 8))
+    assert len(pages[0][0]) == len(store.SUMMARY) + 2
+    assert [r[0] for p in store.scan(since='2025-01-03', until='2025-01-05') for r in p] == [3, 4]
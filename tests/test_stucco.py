@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+import stucco
+from catalog import get_catalog
+
+
+def _price(walls=(), outs=0, caulking=(), misc=()):
+    # ``caulking`` and ``misc`` list the editor rows given a quantity of 10.
+    catalog = get_catalog()
+    subs = {'walls': stucco.table_subtotal('walls', pd.DataFrame(list(walls), columns=['Width', 'Height'])), **dict.fromkeys(stucco.TRIM_TABLES, 0.0)}
+    for name, rows in [('caulking', caulking), ('misc', misc)]:
+        df = catalog.new_pricing('stucco')[name]
+        col = stucco.EDITORS[name]
+        df[col] = [10 if i in rows else None for i in range(len(df))]
+        subs[name] = stucco.table_subtotal(name, df)
+    return stucco.combine(subs, catalog, outs)
+
+
+def test_wall_area_is_split_at_the_8_foot_line():
+    assert stucco.table_subtotal('walls', pd.DataFrame({'Width': ['20', '30', None], 'Height': ["12'", '6', '9']})) == (340.0, 80.0)
+
+
+def test_each_band_takes_its_own_rate():
+    # 420 SF of wall, 80 of it above 8', bills 5 squares: 95 SF above, 405 below.
+    lines, info, sub = _price([['20', '12'], ['30', '6']])
+    walls = lines[lines['category'] == 'walls'].set_index('item')
+    assert (info['squares'], info['below_sf'], info['above_sf']) == (5, 405, 95)
+    assert walls['qty'].tolist() == [405, 95]
+    assert walls['price'].tolist() == [9.11, 13.00]
+    assert sub == 4924.55
+
+
+def test_ground_work_only_never_takes_ladder_rates():
+    lines, info, _ = _price([['50', '8'], ['50', '8']])
+    assert info['above_sf'] == 0
+    assert not lines['item'].str.contains('above').any()
+
+
+@pytest.mark.parametrize('job, label, minimum', [
+    ({'walls': [['10', '9']]}, 'LOXON', 4200),
+    ({'walls': [['10', '9']], 'caulking': [0]}, 'LOXON', 4200),
+    ({'caulking': [0]}, 'CAULKING', 5600),
+    ({'misc': [8]}, 'CLEAR SEALER', 3500),
+    ({'misc': [1, 11]}, 'SPOT POINTING', 4900),
+])
+def test_small_job_takes_the_minimum_for_its_work(job, label, minimum):
+    lines, info, sub = _price(**job)
+    assert info['minimum'] == minimum
+    assert sub == minimum == lines['total'].sum()
+    assert lines['item'].iloc[-1] == f"Job minimum - {label}"
+
+
+def test_work_no_minimum_covers_is_billed_as_priced():
+    lines, info, sub = _price(misc=[0])
+    assert info['minimum'] == 0
+    assert sub == 600
+    assert 'minimum' not in set(lines['category'])